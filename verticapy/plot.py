@@ -3006,14 +3006,14 @@ def pivot_table(
         columns[0],
         columns[1],
     )
-    vdf.__executeSQL__(
-        query=query, title="Group the features to compute the pivot table"
-    )
-    query_result = vdf.__executeSQL__(
-        query=query, title="Group the features to compute the pivot table"
-    ).fetchall()
+    query_result = [
+        (str(item[0]), str(item[1]), item[2])
+        for item in vdf.__executeSQL__(
+            query=query, title="Group the features to compute the pivot table"
+        ).fetchall()
+    ]
     # Column0 sorted categories
-    all_column0_categories = list(set([str(item[0]) for item in query_result]))
+    all_column0_categories = list(set([item[0] for item in query_result]))
     all_column0_categories.sort()
     try:
         try:
@@ -3028,7 +3028,7 @@ def pivot_table(
     except:
         pass
     # Column1 sorted categories
-    all_column1_categories = list(set([str(item[1]) for item in query_result]))
+    all_column1_categories = list(set([item[1] for item in query_result]))
     all_column1_categories.sort()
     try:
         try:
@@ -3042,21 +3042,14 @@ def pivot_table(
         ]
     except:
         pass
-    all_columns = [
-        ["" for item in all_column0_categories] for item in all_column1_categories
+    all_columns = [[columns[0] + "/" + columns[1]] + all_column0_categories] + [
+        [category] + [""] * len(all_column0_categories)
+        for category in all_column1_categories
     ]
+    column0_idx = {category: j for j, category in enumerate(all_column0_categories, 1)}
+    column1_idx = {category: i for i, category in enumerate(all_column1_categories, 1)}
     for item in query_result:
-        j, i = (
-            all_column0_categories.index(str(item[0])),
-            all_column1_categories.index(str(item[1])),
-        )
-        all_columns[i][j] = item[2]
-    all_columns = [
-        [all_column1_categories[i]] + all_columns[i] for i in range(0, len(all_columns))
-    ]
-    all_columns = [
-        [columns[0] + "/" + columns[1]] + all_column0_categories
-    ] + all_columns
+        all_columns[column1_idx[item[1]]][column0_idx[item[0]]] = item[2]
     if show:
         all_count = [item[2] for item in query_result]
         ax = cmatrix(
@@ -3091,10 +3084,9 @@ def pivot_table(
 def scatter_matrix(
     vdf, columns: list = [], **style_kwds,
 ):
+    vdf_columns = vdf.get_columns()
     for column in columns:
-        if (column not in vdf.get_columns()) and (
-            str_column(column) not in vdf.get_columns()
-        ):
+        if (column not in vdf_columns) and (str_column(column) not in vdf_columns):
             raise MissingColumn("The Virtual Column {} doesn't exist".format(column))
     if not (columns):
         columns = vdf.numcol()
@@ -196,6 +196,24 @@ class TestvDFCombineJoinSort:
         # SELECT COUNT(*) FROM cross_join WHERE Name2 IS NULL;
         assert cross_join["Name2"].count() == 63616
 
+        # when both sizes are known, the smallest relation is put first
+        # without changing the result
+        fresh = market_vd.search("Form = 'Fresh'")
+        n_fresh, n_not_fresh = fresh.shape()[0], not_fresh.shape()[0]
+        cross_join = not_fresh.join(
+            fresh, how="cross", expr1=["Name AS Name1"], expr2=["Name AS Name2"]
+        )
+        assert cross_join.get_columns() == ['"Name1"', '"Name2"']
+        assert cross_join.shape() == (n_fresh * n_not_fresh, 2)
+        # with 'SELECT *', the relations order gives the columns order
+        names, prices = not_fresh.select(["Name"]), fresh.select(["Price"])
+        assert prices.shape()[0] < names.shape()[0]
+        cross_join = names.join(prices, how="cross")
+        assert [elem.replace('"', "").lower() for elem in cross_join.get_columns()] == [
+            "name",
+            "price",
+        ]
+
         # join directly with a Vertica table
         not_dried.to_db("not_dried", relation_type="local")
         table_join = not_fresh.join(
@@ -217,6 +235,15 @@ class TestvDFCombineJoinSort:
 
         assert amazon_narrow.shape() == (6453, 3)
 
+        # the dates keep their type when all the vColumns are dates
+        amazon_dates = amazon_vd.select(["state", "date"])
+        amazon_dates.eval("next_date", "date + 1")
+        amazon_narrow = amazon_dates.narrow(
+            "state", columns=["date", "next_date"], col_name="column", val_name="value",
+        )
+        assert amazon_narrow.shape()[0] == 2 * amazon_vd.shape()[0]
+        assert amazon_narrow["value"].isdate()
+
     def test_vDF_pivot(self, amazon_vd):
         amazon_pivot = amazon_vd.pivot(
             index="date", columns="state", values="number", aggr="sum", prefix="pv_"
@@ -225,9 +252,29 @@ class TestvDFCombineJoinSort:
         assert amazon_pivot.shape() == (239, 28)
         assert amazon_pivot["pv_Acre"].count() == 239
 
+        # the categories can be given instead of being computed
+        amazon_pivot2 = amazon_vd.pivot(
+            index="date",
+            columns="state",
+            values="number",
+            aggr="sum",
+            prefix="pv_",
+            categories=["Acre", "Bahia"],
+        )
+        assert amazon_pivot2.shape() == (239, 3)
+        assert amazon_pivot2["pv_Acre"].sum() == amazon_pivot["pv_Acre"].sum()
+        assert amazon_pivot2["pv_Bahia"].sum() == amazon_pivot["pv_Bahia"].sum()
+
     def testvDF_polynomial_comb(self, iris_vd):
         assert iris_vd.polynomial_comb(r=3).shape() == (150, 25)
 
+        result = iris_vd.polynomial_comb(columns=["SepalLengthCm", "PetalLengthCm"])
+        assert result.shape() == (150, 8)
+        assert result["SepalLengthCm_PetalLengthCm"].category() == "float"
+
+        # no numerical vColumns: an unchanged copy is returned
+        assert iris_vd.select(["Species"]).polynomial_comb().shape() == (150, 1)
+
     def testvDF_recommend(self, market_vd):
         assert market_vd.recommend("Name", "Form").shape() == (126, 4)
 
@@ -318,6 +318,13 @@ class TestvDFCorrelation:
         assert result["value"][4] == pytest.approx(-0.0819798501305434, 1e-2)
         assert result["value"][5] == pytest.approx(-0.00663606854011195, 1e-2)
 
+        # each lag only depends on the rows where its own lags are defined
+        result2 = amazon_vd.pacf(
+            column="number", ts="date", by=["state"], p=[1, 3], show=False,
+        )
+        assert result2["value"][0] == pytest.approx(result["value"][1], 1e-6)
+        assert result2["value"][1] == pytest.approx(result["value"][3], 1e-6)
+
     def test_vDF_regr(self, titanic_vd):
         # testing vDataFrame.regr (method = 'alpha')
         result1 = titanic_vd.regr(
@@ -389,6 +389,17 @@ class TestvDFDescriptiveStat:
         assert result3_3["age"][25] == result3["age"][25]
         assert result3_3["age"][26] == result3["age"][26]
 
+    def test_vDF_agg_cache(self, amazon_vd):
+        # the cached aggregations have the same types as the computed ones
+        amazon_copy = amazon_vd.copy()
+        result1 = amazon_copy.agg(func=["min", "max"], columns=["date"])
+        result2 = amazon_copy.agg(func=["min", "max"], columns=["date"])
+        result3 = amazon_copy.agg(func=["min", "count"], columns=["date"])
+        assert result1["min"][0] == result2["min"][0] == result3["min"][0]
+        assert type(result1["min"][0]) == type(result2["min"][0])
+        assert type(result1["min"][0]) == type(result3["min"][0])
+        assert type(result1["max"][0]) == type(result2["max"][0])
+
     def test_vDF_all(self, titanic_vd):
         result = titanic_vd.all(columns=["survived"])
         assert result["bool_and"][0] == 0.0
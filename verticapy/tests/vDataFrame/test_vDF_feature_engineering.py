@@ -288,6 +288,22 @@ class TestvDFFeatureEngineering:
         )
         assert titanic_copy["var"].median() == pytest.approx(0.628787878787879)
 
+        # a failing rolling leaves the vDataFrame unchanged
+        titanic_copy = titanic_vd.copy()
+        columns = titanic_copy.get_columns()
+        history = len(titanic_copy._VERTICAPY_VARIABLES_["history"])
+        with pytest.raises(errors.QueryError):
+            titanic_copy.rolling(
+                func="skewness",
+                window=("- 1 day", "0 day"),
+                columns="age",
+                name="skewness",
+                order_by=["name"],
+            )
+        assert titanic_copy.get_columns() == columns
+        assert len(titanic_copy._VERTICAPY_VARIABLES_["history"]) == history
+        assert titanic_copy.shape() == titanic_vd.shape()
+
     def test_vDF_analytic(self, titanic_vd):
         # func = "aad"
         titanic_copy = titanic_vd.copy()
@@ -363,6 +379,21 @@ class TestvDFFeatureEngineering:
         titanic_copy.analytic(func="jb", columns="age", name="jb")
         assert titanic_copy["jb"].min() == pytest.approx(28.802353)
 
+        # func = "kurtosis" / "skewness" by partition
+        titanic_copy = titanic_vd.copy()
+        titanic_copy.analytic(
+            func="kurtosis", columns="age", by=["pclass"], name="kurtosis"
+        )
+        titanic_copy.analytic(
+            func="skewness", columns="age", by=["pclass"], name="skewness"
+        )
+        assert len(titanic_copy.get_columns()) == len(titanic_vd.get_columns()) + 2
+        for pclass in [1, 2, 3]:
+            group = titanic_vd.search("pclass = {}".format(pclass))
+            result = titanic_copy.search("pclass = {}".format(pclass))
+            assert result["kurtosis"].max() == pytest.approx(group["age"].kurt())
+            assert result["skewness"].max() == pytest.approx(group["age"].skew())
+
         # func = "lead"
         titanic_copy = titanic_vd.copy()
         titanic_copy.analytic(
@@ -91,6 +91,16 @@ class TestvDFFilterSample:
         assert result2["pclass"][0] == 1
         assert result2["pclass"][1] == 1
 
+        # testing usecols without expr
+        result3 = titanic_vd.search(
+            conditions="age BETWEEN 30 AND 70",
+            usecols=["pclass", "age"],
+            order_by={"age": "desc"},
+        )
+        assert result3.shape() == (456, 2)
+        assert result3.get_columns() == ['"pclass"', '"age"']
+        assert result3["age"][0] == 70.0
+
     def test_vDF_at_time(self, smart_meters_vd):
         result = smart_meters_vd.copy().at_time(ts="time", time="12:00",)
         assert result.shape() == (140, 3)
@@ -145,6 +155,16 @@ class TestvDFFilterSample:
             val=["SERGIPE", "TOCANTINS", "PARIS"]
         ).shape() == (478, 3)
 
+        # testing vDataFrame.isin with a single vColumn and a NULL value
+        assert amazon_vd.isin(
+            {"state": ["SERGIPE", "TOCANTINS", "PARIS"]}
+        ).shape() == (478, 3)
+        assert (
+            amazon_vd.isin({"number": [0, None]}).shape()[0]
+            == amazon_vd.isin({"number": [0]}).shape()[0]
+            + amazon_vd.search("number IS NULL").shape()[0]
+        )
+
     def test_vDF_last(self, smart_meters_vd):
         result = smart_meters_vd.copy().last(ts="time", offset="1 year",)
         assert result.shape() == (7018, 3)
@@ -201,3 +221,19 @@ class TestvDFFilterSample:
         assert result2.shape()[0] == pytest.approx(200, 0.12)
         result3 = titanic_vd.copy().sample(n=200, method="systematic")
         assert result3.shape()[0] == pytest.approx(200, 0.12)
+
+        # testing the seeded random sampling
+        result = titanic_vd.sample(x=0.33, method="random")
+        result2 = titanic_vd.sample(x=0.33, method="random")
+        assert result.shape() == result2.shape()
+        assert result.get_columns() == titanic_vd.get_columns()
+        assert titanic_vd.shape() == (1234, 14)
+
+        # testing the parameters validation
+        with pytest.raises(AssertionError):
+            titanic_vd.sample(x=1.5)
+        with pytest.raises(AssertionError):
+            titanic_vd.sample(x=0.33, method="random", by=["pclass"])
+        with pytest.raises(AssertionError):
+            titanic_vd.sample(x=0.33, method="stratified")
+        assert titanic_vd.get_columns() == result.get_columns()
@@ -344,6 +344,15 @@ class TestvDFPlot:
         assert result.get_default_bbox_extra_artists()[-2].get_size() == (5, 4)
         plt.close("all")
 
+        # the vColumns names are case insensitive and must be numerical
+        result = iris_vd.heatmap(
+            ["petallengthcm", "sepallengthcm"], method="avg", of="sepalwidthcm", h=(1, 1),
+        )
+        assert result.get_default_bbox_extra_artists()[-2].get_size() == (5, 4)
+        plt.close("all")
+        with pytest.raises(AssertionError):
+            iris_vd.heatmap(["PetalLengthCm", "Species"])
+
     def test_vDF_hexbin(self, titanic_vd):
         result = titanic_vd.hexbin(columns=["fare", "age"], img=os.path.dirname(verticapy.__file__) + "/tests/vDataFrame/img_test.png", bbox=[0, 10, 0, 10],)
         result = result.get_default_bbox_extra_artists()[0]
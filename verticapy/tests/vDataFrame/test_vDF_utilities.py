@@ -171,6 +171,87 @@ class TestvDFUtilities:
         os.remove("verticapy_test_{}.csv".format(session_id))
         file.close()
 
+        # testing the export by chunks
+        titanic_vd.copy().select(["age", "fare"]).sort({"age": "desc", "fare": "desc"})[
+            0:2
+        ].to_csv("verticapy_test_{}".format(session_id), limit=1)
+        try:
+            file = open("verticapy_test_{}.csv".format(session_id), "r")
+            result = file.read()
+            assert result == "age,fare\n80.000,30.00000\n76.000,78.85000"
+        except:
+            os.remove("verticapy_test_{}.csv".format(session_id))
+            file.close()
+            raise
+        os.remove("verticapy_test_{}.csv".format(session_id))
+        file.close()
+
+        # testing the default batches on the whole relation
+        titanic_vd.copy().select(["name", "age"]).to_csv(
+            "verticapy_test_{}".format(session_id)
+        )
+        try:
+            file = open("verticapy_test_{}.csv".format(session_id), "r")
+            result = file.read().split("\n")
+            assert len(result) == 1235
+            assert result[0] == "name,age"
+        except:
+            os.remove("verticapy_test_{}.csv".format(session_id))
+            file.close()
+            raise
+        os.remove("verticapy_test_{}.csv".format(session_id))
+        file.close()
+
+        # testing the formatting by type
+        vdf = titanic_vd.copy().select(["age", "fare"]).sort(
+            {"age": "desc", "fare": "desc"}
+        )[0:2]
+        vdf.eval("text", "'x'")
+        vdf.eval("missing", "NULL::int")
+        vdf.to_csv("verticapy_test_{}".format(session_id), na_rep="NA")
+        try:
+            file = open("verticapy_test_{}.csv".format(session_id), "r")
+            result = file.read()
+            assert (
+                result
+                == 'age,fare,text,missing\n80.000,30.00000,"x",NA\n76.000,78.85000,"x",NA'
+            )
+        except:
+            os.remove("verticapy_test_{}.csv".format(session_id))
+            file.close()
+            raise
+        os.remove("verticapy_test_{}.csv".format(session_id))
+        file.close()
+
+        # testing the quotechar escaping
+        vdf = titanic_vd.copy().select(["age"]).sort({"age": "desc"})[0:1]
+        vdf.eval("text", "'a\"b'")
+        vdf.to_csv("verticapy_test_{}".format(session_id))
+        try:
+            file = open("verticapy_test_{}.csv".format(session_id), "r")
+            result = file.read()
+            assert result == 'age,text\n80.000,"a""b"'
+        except:
+            os.remove("verticapy_test_{}.csv".format(session_id))
+            file.close()
+            raise
+        os.remove("verticapy_test_{}.csv".format(session_id))
+        file.close()
+
+        # testing that a failed export does not create the file
+        from vertica_python.errors import QueryError
+
+        with pytest.raises(QueryError):
+            titanic_vd.to_csv(
+                "verticapy_test_{}".format(session_id), usecols=["age", "wrong_name"]
+            )
+        assert not (os.path.exists("verticapy_test_{}.csv".format(session_id)))
+        with pytest.raises(QueryError):
+            titanic_vd.to_json(
+                "verticapy_test_{}".format(session_id), usecols=["age", "wrong_name"]
+            )
+        assert not (os.path.exists("verticapy_test_{}.json".format(session_id)))
+
     def test_vDF_to_db(self, titanic_vd):
         try:
             with warnings.catch_warnings(record=True) as w:
@@ -329,15 +410,46 @@ class TestvDFUtilities:
         os.remove("verticapy_test_{}.json".format(session_id))
         file.close()
 
+        # testing the export by chunks
+        titanic_vd.copy().select(["age", "fare"]).sort({"age": "desc", "fare": "desc"})[
+            0:2
+        ].to_json("verticapy_test_{}".format(session_id), limit=1)
+        try:
+            file = open("verticapy_test_{}.json".format(session_id), "r")
+            result = file.read()
+            assert (
+                result
+                == '[\n{"age": 80.000, "fare": 30.00000},\n{"age": 76.000, "fare": 78.85000},\n]'
+            )
+        except:
+            os.remove("verticapy_test_{}.json".format(session_id))
+            file.close()
+            raise
+        os.remove("verticapy_test_{}.json".format(session_id))
+        file.close()
+
     def test_vDF_to_list(self, titanic_vd):
         result = titanic_vd.select(["age", "survived"])[:20].to_list()
         assert len(result) == 20
         assert len(result[0]) == 2
 
+        # testing the conversion of the numerical values
+        result = titanic_vd.select(["age", "survived"]).to_list()
+        assert all(isinstance(elem[0], (float, type(None))) for elem in result)
+        assert all(isinstance(elem[1], int) for elem in result)
+        assert len([elem for elem in result if elem[0] == None]) == 1234 - titanic_vd[
+            "age"
+        ].count()
+
     def test_vDF_to_numpy(self, titanic_vd):
         result = titanic_vd.select(["age", "survived"])[:20].to_numpy()
         assert result.shape == (20, 2)
 
+        # testing the float vColumns
+        result = titanic_vd.search("fare IS NOT NULL", usecols=["fare"]).to_numpy()
+        assert result.dtype == float
+        assert result[:, 0].sum() == pytest.approx(titanic_vd["fare"].sum())
+
     def test_vDF_to_pandas(self, titanic_vd):
         import pandas
 
@@ -406,6 +518,25 @@ class TestvDFUtilities:
         assert len(result._VERTICAPY_VARIABLES_["saving"]) == 0
         assert result.shape() == (1234, 14)
 
+        # the savings are copies which can be loaded many times
+        result = titanic_vd.copy()
+        result._VERTICAPY_VARIABLES_["saving"] = []
+        result.save()
+        assert isinstance(result._VERTICAPY_VARIABLES_["saving"][0], vDataFrame)
+        result.filter("age < 40")
+        loaded = result.load()
+        assert loaded.shape() == (1234, 14)
+        loaded.filter("age < 40")
+        assert result.load().shape() == (1234, 14)
+
+        # the pickled savings of previous versions are still loaded
+        import pickle
+
+        saving = titanic_vd.copy()
+        saving._VERTICAPY_VARIABLES_["cursor"] = None
+        result._VERTICAPY_VARIABLES_["saving"] = [pickle.dumps(saving)]
+        assert result.load().shape() == (1234, 14)
+
     def test_vDF_save(self, titanic_vd):
         result = titanic_vd.copy()
         result._VERTICAPY_VARIABLES_["saving"] = []
@@ -458,6 +589,15 @@ class TestvDFUtilities:
         result = titanic_vd.current_relation().split(".")[1].replace('"', "")
         assert result == "titanic"
 
+        # the memoized relation is generated again when the structure changes
+        result = titanic_vd.copy()
+        result["fare"].apply("{} * 2")
+        relation = result.current_relation()
+        assert result.current_relation() == relation
+        result.filter("age > 10")
+        assert result.current_relation() != relation
+        assert "age > 10" in result.current_relation()
+
     def test_vDF_datecol(self, amazon_vd):
         result = [elem.replace('"', "") for elem in amazon_vd.datecol()]
         result.sort()
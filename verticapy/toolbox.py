@@ -49,7 +49,7 @@
 # Modules
 #
 # Standard Python Modules
-import os, math, shutil, re, sys, warnings, random, itertools
+import os, math, shutil, re, sys, warnings, random, itertools, functools
 from collections.abc import Iterable
 
 # VerticaPy Modules
@@ -260,11 +260,7 @@ def check_types(types_list: list = [],):
 # ---#
 def column_check_ambiguous(column: str, columns: list):
     column = column.replace('"', "").lower()
-    for col in columns:
-        col = col.replace('"', "").lower()
-        if column == col:
-            return True
-    return False
+    return any(column == col.replace('"', "").lower() for col in columns)
 
 
 # ---#
@@ -504,6 +500,15 @@ def gen_name(L: list):
         ]
     )
 
+
+# ---#
+_TMP_ID_COUNTER = itertools.count()
+
+
+def gen_tmp_id():
+    return "{}_{}".format(os.getpid(), next(_TMP_ID_COUNTER))
+
+
 # ---#
 def get_narrow_tablesample(t, use_number_as_category: bool = False):
     result = []
@@ -677,9 +682,8 @@ def isnotebook():
 # ---#
 def last_order_by(vdf):
     max_pos, order_by = 0, ""
-    columns_tmp = [elem for elem in vdf.get_columns()]
-    for column in columns_tmp:
-        max_pos = max(max_pos, len(vdf[column].transformations) - 1)
+    for column in vdf.get_columns():
+        max_pos = max(max_pos, len(getattr(vdf, column).transformations) - 1)
     if max_pos in vdf._VERTICAPY_VARIABLES_["order_by"]:
         order_by = vdf._VERTICAPY_VARIABLES_["order_by"][max_pos]
     return order_by
@@ -1073,6 +1077,7 @@ def str_column(column: str):
 
 
 # ---#
+@functools.lru_cache(maxsize=4096)
 def str_function(key: str, method: str = ""):
     key = key.lower()
     if key in ("median", "med", "approximate_median"):
@@ -2395,15 +2395,11 @@ Attributes
         check_types([("y", y, [str],), ("bins", bins, [int],)])
         columns_check([y], self.parent)
         y = vdf_columns_names([y], self.parent)[0]
-        assert self.parent[y].nunique() == 2, TypeError(
-            "vColumn {} must be binary to use iv_woe.".format(y)
-        )
         response_cat = self.parent[y].distinct()
         response_cat.sort()
         assert response_cat == [0, 1], TypeError(
             "vColumn {} must be binary to use iv_woe.".format(y)
         )
-        self.parent[y].distinct()
         trans = self.discretize(
             method="same_width" if self.isnum() else "topk",
             bins=bins,
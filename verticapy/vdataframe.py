@@ -50,7 +50,8 @@
 # Standard Python Modules
 import random, time, shutil, re, decimal, warnings, pickle, datetime, math
 from collections.abc import Iterable
-from itertools import combinations_with_replacement
+from itertools import chain, combinations_with_replacement
+from operator import itemgetter
 from typing import Union
 
 pickle.DEFAULT_PROTOCOL = 4
@@ -136,6 +137,7 @@ _VERTICAPY_VARIABLES_: dict
         saving, list          : List to use to reconstruct the vDataFrame.
         schema, str           : Schema of the input relation.
         schema_writing, str   : Schema to use to create temporary tables when needed.
+        sql_cache, tuple      : Last generated final relation and its signature.
         where, list           : List of all rules to filter the vDataFrame.
 vColumns : vColumn
     Each vColumn of the vDataFrame is accessible by entering its name between brackets
@@ -390,6 +392,51 @@ vColumns : vColumn
         ]
         return self
 
+    # ---#
+    def __add_vcolumn__(self, name: str, expr: str, ctype: str):
+        """
+    ---------------------------------------------------------------------------
+    Adds a new vColumn using an expression whose type is already known.
+
+    Parameters
+    ----------
+    name: str
+        Name of the new vColumn. It must be already quoted.
+    expr: str
+        Expression in pure SQL to use to compute the new feature.
+    ctype: str
+        The expression database type.
+
+    Returns
+    -------
+    vDataFrame
+        self
+        """
+        ctype = ctype if (ctype) else "undefined"
+        category = category_from_type(ctype=ctype)
+        all_cols, max_floor = self.get_columns(), 0
+        for column in all_cols:
+            if (str_column(column) in expr) or (
+                re.search(re.compile("\\b{}\\b".format(column.replace('"', ""))), expr)
+            ):
+                max_floor = max(len(self[column].transformations), max_floor)
+        transformations = [
+            (
+                "___VERTICAPY_UNDEFINED___",
+                "___VERTICAPY_UNDEFINED___",
+                "___VERTICAPY_UNDEFINED___",
+            )
+            for i in range(max_floor)
+        ] + [(expr, ctype, category)]
+        new_vColumn = vColumn(name, parent=self, transformations=transformations)
+        setattr(self, name, new_vColumn)
+        setattr(self, name.replace('"', ""), new_vColumn)
+        self._VERTICAPY_VARIABLES_["columns"] += [name]
+        self.__add_to_history__(
+            "[Eval]: A new vColumn {} was added to the vDataFrame.".format(name)
+        )
+        return self
+
     # ---#
     def __aggregate_matrix__(
         self,
@@ -419,6 +466,22 @@ vColumns : vColumn
         if method != "cramer":
             for column in columns:
                 assert self[column].isnum(), TypeError(f"vColumn {column} must be numerical to compute the {method_name} Matrix{method_type}.")
+
+        def cramer_query(column1, column2):
+            # The marginal counts are computed on the contingency table with
+            # window functions, the relation is then scanned only once.
+            table_0_1 = "SELECT {}, {}, COUNT(*) AS nij FROM {} WHERE {} IS NOT NULL AND {} IS NOT NULL GROUP BY 1, 2".format(
+                column1, column2, self.__genSQL__(), column1, column2
+            )
+            table = "SELECT {}, {}, nij, SUM(nij) OVER (PARTITION BY {}) AS ni, SUM(nij) OVER (PARTITION BY {}) AS nj, SUM(nij) OVER () AS n FROM ({}) table_0_1".format(
+                column1, column2, column1, column2, table_0_1
+            )
+            chi2 = "SELECT SUM((nij - ni * nj / n) * (nij - ni * nj / n) / ((ni * nj) / n)) AS chi2, MAX(n) AS n, APPROXIMATE_COUNT_DISTINCT({}) AS k, APPROXIMATE_COUNT_DISTINCT({}) AS r FROM ({}) x".format(
+                column1, column2, table
+            )
+            return "SELECT (CASE WHEN cramer > 1 THEN NULL ELSE cramer END) FROM (SELECT SQRT(chi2 / n / NULLIF(LEAST(k, r) - 1, 0)) AS cramer FROM ({}) y) z".format(
+                chi2
+            )
         if len(columns) == 1:
             if method in ("pearson", "spearman", "kendall", "biserial", "cramer"):
                 return 1.0
@@ -506,46 +569,14 @@ vColumns : vColumn
             elif method == "cramer":
                 if columns[1] == columns[0]:
                     return 1
-                table_0_1 = "SELECT {}, {}, COUNT(*) AS nij FROM {} WHERE {} IS NOT NULL AND {} IS NOT NULL GROUP BY 1, 2".format(
-                    columns[0], columns[1], self.__genSQL__(), columns[0], columns[1]
-                )
-                table_0 = "SELECT {}, COUNT(*) AS ni FROM {} WHERE {} IS NOT NULL AND {} IS NOT NULL GROUP BY 1".format(
-                    columns[0], self.__genSQL__(), columns[0], columns[1]
-                )
-                table_1 = "SELECT {}, COUNT(*) AS nj FROM {} WHERE {} IS NOT NULL AND {} IS NOT NULL GROUP BY 1".format(
-                    columns[1], self.__genSQL__(), columns[0], columns[1]
-                )
-                sql = "SELECT COUNT(*) AS n, APPROXIMATE_COUNT_DISTINCT({}) AS k, APPROXIMATE_COUNT_DISTINCT({}) AS r FROM {} WHERE {} IS NOT NULL AND {} IS NOT NULL".format(
-                    columns[0], columns[1], self.__genSQL__(), columns[0], columns[1]
-                )
-                self._VERTICAPY_VARIABLES_["cursor"].execute(sql)
-                n, k, r = self._VERTICAPY_VARIABLES_["cursor"].fetchone()
-                chi2 = "SELECT SUM((nij - ni * nj / {}) * (nij - ni * nj / {}) / ((ni * nj) / {})) AS chi2 FROM (SELECT * FROM ({}) table_0_1 LEFT JOIN ({}) table_0 ON table_0_1.{} = table_0.{}) x LEFT JOIN ({}) table_1 ON x.{} = table_1.{}".format(
-                    n,
-                    n,
-                    n,
-                    table_0_1,
-                    table_0,
-                    columns[0],
-                    columns[0],
-                    table_1,
-                    columns[1],
-                    columns[1],
-                )
                 self.__executeSQL__(
-                    chi2,
+                    cramer_query(columns[0], columns[1]),
                     title="Computes the CramerV correlation between {} and {} (Chi2 Statistic).".format(
                         columns[0], columns[1]
                     ),
                 )
                 result = self._VERTICAPY_VARIABLES_["cursor"].fetchone()[0]
-                if min(k - 1, r - 1) == 0:
-                    result = float("nan")
-                else:
-                    result = float(math.sqrt(result / n / min(k - 1, r - 1)))
-                    if result > 1 or result < 0:
-                        result = float("nan")
-                return result
+                return float("nan") if (result == None) else float(result)
             elif method == "kendall":
                 if columns[1] == columns[0]:
                     return 1
@@ -774,6 +805,10 @@ vColumns : vColumn
                                         columns[i], cast_i, columns[j], cast_j
                                     )
                                 ]
+                            elif method == "cramer":
+                                all_list += [
+                                    "({})".format(cramer_query(columns[i], columns[j]))
+                                ]
                             else:
                                 raise
                     if method == "spearman":
@@ -797,6 +832,12 @@ vColumns : vColumn
                         self._VERTICAPY_VARIABLES_["cursor"].execute(
                             "SELECT {}".format(", ".join(all_list))
                         )
+                    elif method == "cramer":
+                        # Each pair is a scalar subquery of the same statement.
+                        self.__executeSQL__(
+                            query="SELECT {}".format(", ".join(all_list)),
+                            title=title_query,
+                        )
                     else:
                         self.__executeSQL__(
                             query="SELECT {} FROM {}".format(
@@ -926,6 +967,7 @@ vColumns : vColumn
                 method_type = ""
             for column in cols:
                 assert self[column].isnum(), TypeError(f"vColumn {column} must be numerical to compute the {method_name} Vector{method_type}.")
+        focus_name = focus.replace('"', "").lower()
         if method in ("spearman", "pearson", "kendall", "cov") and (len(cols) >= 1):
             try:
                 fail = 0
@@ -933,10 +975,7 @@ vColumns : vColumn
                 all_list, all_cols = [], [focus]
                 nb_precomputed = 0
                 for column in cols:
-                    if (
-                        column.replace('"', "").lower()
-                        != focus.replace('"', "").lower()
-                    ):
+                    if column.replace('"', "").lower() != focus_name:
                         all_cols += [column]
                     cast_j = "::int" if (self[column].isbool()) else ""
                     pre_comp_val = self.__get_catalog_value__(
@@ -1045,7 +1084,7 @@ vColumns : vColumn
         ) or (fail):
             vector = []
             for column in cols:
-                if column.replace('"', "").lower() == focus.replace('"', "").lower():
+                if column.replace('"', "").lower() == focus_name:
                     vector += [1]
                 else:
                     vector += [
@@ -1122,6 +1161,51 @@ vColumns : vColumn
         """
         return executeSQL(self._VERTICAPY_VARIABLES_["cursor"], query, title,)
 
+    # ---#
+    def __format_columns__(
+        self, columns: list, of: str = "", columns_nb: list = None, plot: str = "",
+    ):
+        """
+    ---------------------------------------------------------------------------
+    Checks and formats the input vColumns names in a single pass.
+
+    Parameters
+    ----------
+    columns: list
+        List of the vColumns names.
+    of: str, optional
+        Name of the vColumn used to compute an aggregation.
+    columns_nb: list, optional
+        List of the allowed numbers of vColumns.
+    plot: str, optional
+        If not empty, all the vColumns must be numerical to draw the 
+        plot having this name.
+
+    Returns
+    -------
+    tuple
+        (vColumns names, formatted 'of')
+        """
+        if columns_nb != None and len(columns) not in columns_nb:
+            columns_check(columns, self, columns_nb)
+        vdf_columns = {
+            str_column(column).lower(): column for column in self.get_columns()
+        }
+        names = []
+        for column in columns + ([of] if of else []):
+            key = str_column(column).lower()
+            if key not in vdf_columns:
+                columns_check([column], self)
+            names += [vdf_columns[key]]
+        if of:
+            of = names.pop()
+        if plot:
+            for column in names:
+                assert getattr(self, column).isnum(), TypeError(
+                    f"vColumn {column} must be numerical to draw the {plot}."
+                )
+        return names, of
+
     # ---#
     def __genSQL__(
         self, split: bool = False, transformations: dict = {}, force_columns: list = [],
@@ -1149,13 +1233,36 @@ vColumns : vColumn
     str
         The SQL final relation.
         """
+        # The final relation only depends on the vDataFrame structure. It is
+        # stored with its signature and generated again only if it changed.
+        use_cache = not (split) and not (transformations) and not (force_columns)
+        if use_cache:
+            signature = (
+                self._VERTICAPY_VARIABLES_["main_relation"],
+                self._VERTICAPY_VARIABLES_["allcols_ind"],
+                tuple(
+                    (
+                        column,
+                        tuple(
+                            item[0] for item in getattr(self, column).transformations
+                        ),
+                    )
+                    for column in self._VERTICAPY_VARIABLES_["columns"]
+                ),
+                tuple(self._VERTICAPY_VARIABLES_["where"]),
+                tuple(sorted(self._VERTICAPY_VARIABLES_["order_by"].items())),
+                tuple(self._VERTICAPY_VARIABLES_["exclude_columns"]),
+            )
+            sql_cache = self._VERTICAPY_VARIABLES_.get("sql_cache")
+            if sql_cache and (sql_cache[0] == signature):
+                return sql_cache[1]
         # The First step is to find the Max Floor
         all_imputations_grammar = []
         if not (force_columns):
             force_columns = [elem for elem in self._VERTICAPY_VARIABLES_["columns"]]
         for column in force_columns:
             all_imputations_grammar += [
-                [item[0] for item in self[column].transformations]
+                [item[0] for item in getattr(self, column).transformations]
             ]
         for column in transformations:
             all_imputations_grammar += [transformations[column]]
@@ -1253,6 +1360,8 @@ vColumns : vColumn
             main_relation
         )
         table = table.replace(all_main_relation, main_relation)
+        if use_cache:
+            self._VERTICAPY_VARIABLES_["sql_cache"] = (signature, table)
         return table
 
     # ---#
@@ -1509,8 +1618,8 @@ vColumns : vColumn
                 vdf = vdf.append(self.search((self[weight] / gcd) >= i, usecols=columns))
         else:
             assert weight >= 2 and isinstance(weight, int), ValueError("The weight must be an integer greater or equal to 2.")
-            vdf = self.copy()
-            for i in range(2, weight + 1):
+            vdf = self.append(self)
+            for i in range(3, weight + 1):
                 vdf = vdf.append(self)
         return vdf
 
@@ -1666,22 +1775,23 @@ vColumns : vColumn
             if confidence:
                 from scipy.special import erfinv
 
+                count, squares_sum = self[column].count(), 0
                 for k in range(1, len(acf) + 1):
                     acf_band += [
                         math.sqrt(2)
                         * erfinv(alpha)
-                        / math.sqrt(self[column].count() - k + 1)
-                        * math.sqrt((1 + 2 * sum([acf[i] ** 2 for i in range(1, k)])))
+                        / math.sqrt(count - k + 1)
+                        * math.sqrt((1 + 2 * squares_sum))
                     ]
+                    if k < len(acf):
+                        squares_sum += acf[k] ** 2
             if columns[0] == column:
                 columns[0] = 0
             for i in range(1, len(columns)):
                 columns[i] = int(columns[i].split("_")[1])
-            data = [(columns[i], acf[i]) for i in range(len(columns))]
-            data.sort(key=lambda tup: tup[0])
+            data = sorted(zip(columns, acf), key=itemgetter(0))
             del result.values[column]
-            result.values["index"] = [elem[0] for elem in data]
-            result.values["value"] = [elem[1] for elem in data]
+            result.values["index"], result.values["value"] = map(list, zip(*data))
             if acf_band:
                 result.values["confidence"] = acf_band
             if show:
@@ -1805,12 +1915,24 @@ vColumns : vColumn
                         if elem != "index":
                             result.values[elem] = result_tmp[elem]
             return result.transpose()
+        # 'mad', 'aad' and 'cvar' need a first statistic of each vColumn. They
+        # are all computed in one query and then read from the catalog.
+        if verticapy.options["cache"]:
+            prerequisites = {"mad": "median", "aad": "avg", "cvar": "95%"}
+            prerequisites = [
+                prerequisites[fun.lower()]
+                for fun in func
+                if isinstance(fun, str) and (fun.lower() in prerequisites)
+            ]
+            if prerequisites:
+                self.aggregate(func=sorted(set(prerequisites)), columns=columns)
         agg = [[] for i in range(len(columns))]
-        nb_precomputed = 0
+        nb_precomputed, pre_comp_values = 0, []
         for idx, column in enumerate(columns):
             cast = "::int" if (self[column].isbool()) else ""
             for fun in func:
                 pre_comp = self.__get_catalog_value__(column, fun)
+                pre_comp_values += [pre_comp if (pre_comp == pre_comp) else None]
                 if pre_comp != "VERTICAPY_NOT_PRECOMPUTED":
                     nb_precomputed += 1
                     if pre_comp == None or pre_comp != pre_comp:
@@ -2014,12 +2136,12 @@ vColumns : vColumn
                     pass
         values = {"index": func}
         try:
+            # When all the aggregations are already in the catalog, they are
+            # read directly without sending any query. Otherwise, the cached
+            # values are taken from the catalog rather than from their SQL
+            # literal so that both paths return the same types.
             if nb_precomputed == len(func) * len(columns):
-                self._VERTICAPY_VARIABLES_["cursor"].execute(
-                    "SELECT {}".format(
-                        ", ".join([str(item) for sublist in agg for item in sublist])
-                    )
-                )
+                result = pre_comp_values
             else:
                 self.__executeSQL__(
                     "SELECT {} FROM {} LIMIT 1".format(
@@ -2028,7 +2150,12 @@ vColumns : vColumn
                     ),
                     title="Computes the different aggregations.",
                 )
-            result = [item for item in self._VERTICAPY_VARIABLES_["cursor"].fetchone()]
+                result = [
+                    item if (pre_comp == "VERTICAPY_NOT_PRECOMPUTED") else pre_comp
+                    for item, pre_comp in zip(
+                        self._VERTICAPY_VARIABLES_["cursor"].fetchone(), pre_comp_values
+                    )
+                ]
             try:
                 result = [float(item) for item in result]
             except:
@@ -2305,97 +2432,90 @@ vColumns : vColumn
                     )
                 )
             if func in ("skewness", "kurtosis", "aad", "mad", "jb"):
-                mean_name = "{}_mean_{}".format(
-                    columns[0].replace('"', ""), random.randint(0, 10000000)
-                )
-                median_name = "{}_median_{}".format(
-                    columns[0].replace('"', ""), random.randint(0, 10000000)
-                )
-                std_name = "{}_std_{}".format(
-                    columns[0].replace('"', ""), random.randint(0, 10000000)
-                )
-                count_name = "{}_count_{}".format(
-                    columns[0].replace('"', ""), random.randint(0, 10000000)
-                )
-                all_cols = [elem for elem in self._VERTICAPY_VARIABLES_["columns"]]
+                column_name = columns[0].replace('"', "")
+                mean_name = "{}_mean_{}".format(column_name, gen_tmp_id())
+                median_name = "{}_median_{}".format(column_name, gen_tmp_id())
+                count_name = "{}_count_{}".format(column_name, gen_tmp_id())
+                if func in ("skewness", "kurtosis", "jb"):
+                    moments_name = {
+                        k: "{}_m{}_{}".format(column_name, k, gen_tmp_id())
+                        for k in {"skewness": (2, 3), "kurtosis": (2, 4)}.get(
+                            func, (2, 3, 4)
+                        )
+                    }
+                # The helper windows have known types, so they are added
+                # without type query: the final expression validates them.
+                history_len = len(self._VERTICAPY_VARIABLES_["history"])
                 if func == "mad":
-                    self.eval(
-                        median_name, "MEDIAN({}) OVER ({})".format(columns[0], by)
+                    self.__add_vcolumn__(
+                        str_column(median_name),
+                        "MEDIAN({}) OVER ({})".format(columns[0], by),
+                        "float",
                     )
                 else:
-                    self.eval(mean_name, "AVG({}) OVER ({})".format(columns[0], by))
+                    self.__add_vcolumn__(
+                        str_column(mean_name),
+                        "AVG({}) OVER ({})".format(columns[0], by),
+                        "float",
+                    )
                 if func not in ("aad", "mad"):
-                    self.eval(std_name, "STDDEV({}) OVER ({})".format(columns[0], by))
-                    self.eval(count_name, "COUNT({}) OVER ({})".format(columns[0], by))
-                if func == "kurtosis":
-                    self.eval(
-                        name,
-                        "AVG(POWER(({} - {}) / NULLIFZERO({}), 4)) OVER ({}) * POWER({}, 2) * ({} + 1) / NULLIFZERO(({} - 1) * ({} - 2) * ({} - 3)) - 3 * POWER({} - 1, 2) / NULLIFZERO(({} - 2) * ({} - 3))".format(
-                            columns[0],
-                            mean_name,
-                            std_name,
-                            by,
-                            count_name,
-                            count_name,
-                            count_name,
-                            count_name,
-                            count_name,
-                            count_name,
-                            count_name,
-                            count_name,
-                        ),
+                    # kurtosis, skewness and jb are all derived from the
+                    # same window sums of the central moments.
+                    self.__add_vcolumn__(
+                        str_column(count_name),
+                        "COUNT({}) OVER ({})".format(columns[0], by),
+                        "int",
                     )
-                elif func == "skewness":
-                    self.eval(
-                        name,
-                        "AVG(POWER(({} - {}) / NULLIFZERO({}), 3)) OVER ({}) * POWER({}, 2) / NULLIFZERO(({} - 1) * ({} - 2))".format(
-                            columns[0],
-                            mean_name,
-                            std_name,
-                            by,
-                            count_name,
-                            count_name,
-                            count_name,
-                        ),
+                    for k in moments_name:
+                        self.__add_vcolumn__(
+                            str_column(moments_name[k]),
+                            "SUM(POWER({} - {}, {})) OVER ({})".format(
+                                columns[0], mean_name, k, by
+                            ),
+                            "float",
+                        )
+                if func in ("skewness", "jb"):
+                    skewness = "{1} * {0} * SQRT(NULLIFZERO({0}) - 1) / NULLIFZERO(POWER({2}, 1.5) * ({0} - 2))".format(
+                        count_name, moments_name[3], moments_name[2]
+                    )
+                if func in ("kurtosis", "jb"):
+                    kurtosis = "{1} * {0} * ({0} + 1) * ({0} - 1) / NULLIFZERO(POWER({2}, 2) * ({0} - 2) * ({0} - 3)) - 3 * POWER({0} - 1, 2) / NULLIFZERO(({0} - 2) * ({0} - 3))".format(
+                        count_name, moments_name[4], moments_name[2]
                     )
+                if func == "kurtosis":
+                    expr = kurtosis
+                    helpers = [mean_name, count_name] + list(moments_name.values())
+                elif func == "skewness":
+                    expr = skewness
+                    helpers = [mean_name, count_name] + list(moments_name.values())
                 elif func == "jb":
-                    self.eval(
-                        name,
-                        "{} / 6 * (POWER(AVG(POWER(({} - {}) / NULLIFZERO({}), 3)) OVER ({}) * POWER({}, 2) / NULLIFZERO(({} - 1) * ({} - 2)), 2) + POWER(AVG(POWER(({} - {}) / NULLIFZERO({}), 4)) OVER ({}) * POWER({}, 2) * ({} + 1) / NULLIFZERO(({} - 1) * ({} - 2) * ({} - 3)) - 3 * POWER({} - 1, 2) / NULLIFZERO(({} - 2) * ({} - 3)), 2) / 4)".format(
-                            count_name,
-                            columns[0],
-                            mean_name,
-                            std_name,
-                            by,
-                            count_name,
-                            count_name,
-                            count_name,
-                            columns[0],
-                            mean_name,
-                            std_name,
-                            by,
-                            count_name,
-                            count_name,
-                            count_name,
-                            count_name,
-                            count_name,
-                            count_name,
-                            count_name,
-                            count_name,
-                        ),
+                    expr = "{} / 6 * (POWER({}, 2) + POWER({}, 2) / 4)".format(
+                        count_name, skewness, kurtosis
                     )
+                    helpers = [mean_name, count_name] + list(moments_name.values())
                 elif func == "aad":
-                    self.eval(
-                        name,
-                        "AVG(ABS({} - {})) OVER ({})".format(columns[0], mean_name, by),
+                    expr = "AVG(ABS({} - {})) OVER ({})".format(
+                        columns[0], mean_name, by
                     )
+                    helpers = [mean_name]
                 elif func == "mad":
-                    self.eval(
-                        name,
-                        "AVG(ABS({} - {})) OVER ({})".format(
-                            columns[0], median_name, by
-                        ),
+                    expr = "AVG(ABS({} - {})) OVER ({})".format(
+                        columns[0], median_name, by
                     )
+                    helpers = [median_name]
+                try:
+                    self.eval(name, expr)
+                except:
+                    # The helpers were not type checked: they are removed,
+                    # with their history, to keep the vDataFrame usable.
+                    for elem in helpers:
+                        self._VERTICAPY_VARIABLES_["columns"].remove(
+                            str_column(elem)
+                        )
+                        delattr(self, str_column(elem))
+                        delattr(self, elem)
+                    del self._VERTICAPY_VARIABLES_["history"][history_len:]
+                    raise
             elif func == "top":
                 self.eval(
                     name,
@@ -2578,9 +2698,8 @@ vColumns : vColumn
                 )
         if func in ("kurtosis", "skewness", "jb"):
             self._VERTICAPY_VARIABLES_["exclude_columns"] += [
-                str_column(mean_name),
-                str_column(std_name),
-                str_column(count_name),
+                str_column(elem)
+                for elem in [mean_name, count_name] + list(moments_name.values())
             ]
         elif func in ("aad"):
             self._VERTICAPY_VARIABLES_["exclude_columns"] += [str_column(mean_name)]
@@ -3529,16 +3648,17 @@ vColumns : vColumn
                              vDataFrame.
         """
         check_types([("max_cardinality", max_cardinality, [int, float],)])
-        columns = []
+        columns, table = [], self.__genSQL__()
         for column in self.get_columns():
-            if (self[column].category() == "int") and not (self[column].isbool()):
+            category = getattr(self, column).category()
+            if (category == "int") and not (getattr(self, column).isbool()):
                 self._VERTICAPY_VARIABLES_["cursor"].execute(
                     "SELECT (APPROXIMATE_COUNT_DISTINCT({}) < {}) FROM {}".format(
-                        column, max_cardinality, self.__genSQL__()
+                        column, max_cardinality, table
                     )
                 )
                 is_cat = self._VERTICAPY_VARIABLES_["cursor"].fetchone()[0]
-            elif self[column].category() == "float":
+            elif category == "float":
                 is_cat = False
             else:
                 is_cat = True
@@ -4097,23 +4217,13 @@ vColumns : vColumn
         func = ["count", "percent"] if (percent) else ["count"]
         result = self.aggregate(func=func, columns=columns)
         if sort_result:
-            sort = []
-            for i in range(len(result.values["index"])):
-                if percent:
-                    sort += [
-                        (
-                            result.values["index"][i],
-                            result.values["count"][i],
-                            result.values["percent"][i],
-                        )
-                    ]
-                else:
-                    sort += [(result.values["index"][i], result.values["count"][i])]
-            sort.sort(key=lambda tup: tup[1], reverse=desc)
-            result.values["index"] = [elem[0] for elem in sort]
-            result.values["count"] = [elem[1] for elem in sort]
-            if percent:
-                result.values["percent"] = [elem[2] for elem in sort]
+            sort = sorted(
+                zip(*[result.values[elem] for elem in ["index"] + func]),
+                key=itemgetter(1),
+                reverse=desc,
+            )
+            for elem, values in zip(["index"] + func, zip(*sort)):
+                result.values[elem] = list(values)
         return result
 
     # ---#
@@ -4376,12 +4486,9 @@ vColumns : vColumn
     vDataFrame.numcol : Returns a list of names of the numerical vColumns in the 
                         vDataFrame.
         """
-        columns = []
-        cols = self.get_columns()
-        for column in cols:
-            if self[column].isdate():
-                columns += [column]
-        return columns
+        return [
+            column for column in self.get_columns() if getattr(self, column).isdate()
+        ]
 
     # ---#
     def del_catalog(self):
@@ -4895,11 +5002,7 @@ vColumns : vColumn
                 if not (columns)
                 else vdf_columns_names(columns, self)
             )
-            name = (
-                "__verticapy_duplicated_index__"
-                + str(random.randint(0, 10000000))
-                + "_"
-            )
+            name = "__verticapy_duplicated_index__" + gen_tmp_id() + "_"
             self.eval(
                 name=name,
                 expr="ROW_NUMBER() OVER (PARTITION BY {})".format(", ".join(columns)),
@@ -5012,8 +5115,9 @@ vColumns : vColumn
         columns = (
             self.get_columns() if not (columns) else vdf_columns_names(columns, self)
         )
+        columns_str = ", ".join(columns)
         query = "(SELECT *, ROW_NUMBER() OVER (PARTITION BY {}) AS duplicated_index FROM {}) duplicated_index_table WHERE duplicated_index > 1".format(
-            ", ".join(columns), self.__genSQL__()
+            columns_str, self.__genSQL__()
         )
         self.__executeSQL__(
             query="SELECT COUNT(*) FROM {}".format(query),
@@ -5022,16 +5126,16 @@ vColumns : vColumn
         total = self._VERTICAPY_VARIABLES_["cursor"].fetchone()[0]
         if count:
             return total
+        # The grouped relation is built once and reused by both queries.
+        occurrences = "SELECT {}, MAX(duplicated_index) AS occurrence FROM {} GROUP BY {}".format(
+            columns_str, query, columns_str
+        )
         result = to_tablesample(
-            "SELECT {}, MAX(duplicated_index) AS occurrence FROM {} GROUP BY {} ORDER BY occurrence DESC LIMIT {}".format(
-                ", ".join(columns), query, ", ".join(columns), limit
-            ),
+            "{} ORDER BY occurrence DESC LIMIT {}".format(occurrences, limit),
             self._VERTICAPY_VARIABLES_["cursor"],
         )
         self.__executeSQL__(
-            query="SELECT COUNT(*) FROM (SELECT {}, MAX(duplicated_index) AS occurrence FROM {} GROUP BY {}) t".format(
-                ", ".join(columns), query, ", ".join(columns)
-            ),
+            query="SELECT COUNT(*) FROM ({}) t".format(occurrences),
             title="Computes the number of distinct duplicates.",
         )
         result.count = self._VERTICAPY_VARIABLES_["cursor"].fetchone()[0]
@@ -5098,30 +5202,7 @@ vColumns : vColumn
                 )
             except:
                 raise QueryError(f"The expression '{expr}' seems to be incorrect.\nBy turning on the SQL with the 'set_option' function, you'll print the SQL code generation and probably see why the evaluation didn't work.")
-        ctype = ctype if (ctype) else "undefined"
-        category = category_from_type(ctype=ctype)
-        all_cols, max_floor = self.get_columns(), 0
-        for column in all_cols:
-            if (str_column(column) in expr) or (
-                re.search(re.compile("\\b{}\\b".format(column.replace('"', ""))), expr)
-            ):
-                max_floor = max(len(self[column].transformations), max_floor)
-        transformations = [
-            (
-                "___VERTICAPY_UNDEFINED___",
-                "___VERTICAPY_UNDEFINED___",
-                "___VERTICAPY_UNDEFINED___",
-            )
-            for i in range(max_floor)
-        ] + [(expr, ctype, category)]
-        new_vColumn = vColumn(name, parent=self, transformations=transformations)
-        setattr(self, name, new_vColumn)
-        setattr(self, name.replace('"', ""), new_vColumn)
-        self._VERTICAPY_VARIABLES_["columns"] += [name]
-        self.__add_to_history__(
-            "[Eval]: A new vColumn {} was added to the vDataFrame.".format(name)
-        )
-        return self
+        return self.__add_vcolumn__(name, expr, ctype)
 
     # ---#
     def expected_store_usage(self, unit: str = "b"):
@@ -5227,18 +5308,12 @@ vColumns : vColumn
             values[column] = [expsize, values[column][0] * maxsize, ctype]
             total_expected += values[column][0]
             total += values[column][1]
-        values["separator"] = [
-            len(columns) * self.shape()[0] / div_unit,
-            len(columns) * self.shape()[0] / div_unit,
-            "",
-        ]
+        separator_size = len(columns) * self.shape()[0] / div_unit
+        values["separator"] = [separator_size, separator_size, ""]
         total += values["separator"][0]
         total_expected += values["separator"][0]
-        values["header"] = [
-            (sum([len(item) for item in columns]) + len(columns)) / div_unit,
-            (sum([len(item) for item in columns]) + len(columns)) / div_unit,
-            "",
-        ]
+        header_size = (sum(len(item) for item in columns) + len(columns)) / div_unit
+        values["header"] = [header_size, header_size, ""]
         total += values["header"][0]
         total_expected += values["header"][0]
         values["rawsize"] = [total_expected, total, ""]
@@ -5264,12 +5339,15 @@ vColumns : vColumn
         query = "EXPLAIN SELECT * FROM {}".format(self.__genSQL__())
         self.__executeSQL__(query=query, title="Explaining the Current Relation")
         result = self._VERTICAPY_VARIABLES_["cursor"].fetchall()
-        result = [elem[0] for elem in result]
-        result = "\n".join(result)
+        result = "\n".join(elem[0] for elem in result)
         if not (digraph):
             result = result.replace("------------------------------\n", "")
-            result = result.replace("\\n", "\n\t")
-            result = result.replace(", ", ",").replace(",", ", ").replace("\n}", "}")
+            # The remaining substitutions are done in a single pass.
+            result = re.sub(
+                r"\\n|, ?|\n\}",
+                lambda match: {"\\n": "\n\t", "\n}": "}"}.get(match.group(0), ", "),
+                result,
+            )
         else:
             result = "digraph G {" + result.split("digraph G {")[1]
         return result
@@ -5400,14 +5478,14 @@ vColumns : vColumn
                 print("Nothing was filtered.")
         else:
             max_pos = 0
-            columns_tmp = [elem for elem in self._VERTICAPY_VARIABLES_["columns"]]
-            for column in columns_tmp:
-                max_pos = max(max_pos, len(self[column].transformations) - 1)
+            for column in self._VERTICAPY_VARIABLES_["columns"]:
+                max_pos = max(max_pos, len(getattr(self, column).transformations) - 1)
             new_count = self.shape()[0]
             self._VERTICAPY_VARIABLES_["where"] += [(conditions, max_pos)]
             try:
-                self._VERTICAPY_VARIABLES_["cursor"].execute(
-                    "SELECT COUNT(*) FROM {}".format(self.__genSQL__())
+                self.__executeSQL__(
+                    "SELECT COUNT(*) FROM {}".format(self.__genSQL__()),
+                    title="Computes the new number of elements.",
                 )
                 new_count = self._VERTICAPY_VARIABLES_["cursor"].fetchone()[0]
                 count -= new_count
@@ -5500,19 +5578,19 @@ vColumns : vColumn
     vDataFrame.numcol  : Returns all numerical vDataFrame vColumns.
         """
         if isinstance(exclude_columns, str):
-            exclude_columns = [columns]
+            exclude_columns = [exclude_columns]
         check_types([("exclude_columns", exclude_columns, [list],)])
-        columns = [elem for elem in self._VERTICAPY_VARIABLES_["columns"]]
-        result = []
-        exclude_columns = [elem for elem in exclude_columns]
-        exclude_columns += [
-            elem for elem in self._VERTICAPY_VARIABLES_["exclude_columns"]
+        exclude_columns = {
+            elem.replace('"', "").lower()
+            for elem in chain(
+                exclude_columns, self._VERTICAPY_VARIABLES_["exclude_columns"]
+            )
+        }
+        return [
+            column
+            for column in self._VERTICAPY_VARIABLES_["columns"]
+            if column.replace('"', "").lower() not in exclude_columns
         ]
-        exclude_columns = [elem.replace('"', "").lower() for elem in exclude_columns]
-        for column in columns:
-            if column.replace('"', "").lower() not in exclude_columns:
-                result += [column]
-        return result
 
     # ---#
     def get_dummies(
@@ -5573,8 +5651,20 @@ vColumns : vColumn
         columns = (
             self.get_columns() if not (columns) else vdf_columns_names(columns, self)
         )
+        # When the number of rows is already known and lesser than the threshold,
+        # all the vColumns pass the cardinality test.
+        total = self.__get_catalog_value__("VERTICAPY_COUNT")
+        skip_cardinality = (total != "VERTICAPY_NOT_PRECOMPUTED") and (
+            total < max_cardinality
+        )
         for column in columns:
-            if self[column].nunique(True) < max_cardinality:
+            if skip_cardinality:
+                cardinality = 0
+            else:
+                cardinality = self.__get_catalog_value__(column, "approx_unique")
+                if cardinality == "VERTICAPY_NOT_PRECOMPUTED":
+                    cardinality = self[column].nunique(True)
+            if cardinality < max_cardinality:
                 self[column].get_dummies(
                     "", prefix_sep, drop_first, use_numbers_as_suffix
                 )
@@ -5629,19 +5719,16 @@ vColumns : vColumn
             column = vdf_columns_names([columns[i]], self)
             if column:
                 columns[i] = column[0]
+        columns_str = [str(elem) for elem in columns]
         relation = "(SELECT {} FROM {} GROUP BY {}) VERTICAPY_SUBTABLE".format(
-            ", ".join([str(elem) for elem in columns] + [str(elem) for elem in expr]),
+            ", ".join(chain(columns_str, map(str, expr))),
             self.__genSQL__(),
-            ", ".join(
-                [str(i + 1) for i in range(len([str(elem) for elem in columns]))]
-            ),
+            ", ".join(map(str, range(1, len(columns) + 1))),
         )
         return self.__vdf_from_relation__(
             relation,
             "groupby",
-            "[Groupby]: The columns were grouped by {}".format(
-                ", ".join([str(elem) for elem in columns])
-            ),
+            "[Groupby]: The columns were grouped by {}".format(", ".join(columns_str)),
         )
 
     # ---#
@@ -5655,7 +5742,7 @@ vColumns : vColumn
         kind: str = "boxplot",
         width: int = 600,
         height: int = 400,
-        options: dict = {},
+        options: dict = None,
         h: float = -1,
         max_cardinality: int = 10,
         limit: int = 10000,
@@ -5787,6 +5874,8 @@ vColumns : vColumn
     Highchart
         Chart Object
         """
+        if options is None:
+            options = {}
         check_types([("kind", kind, [str],)])
         kind = kind.lower()
         check_types(
@@ -5837,44 +5926,42 @@ vColumns : vColumn
         )
         from verticapy.hchart import hchart_from_vdf
 
+        params = [
+            self,
+            x,
+            y,
+            z,
+            c,
+            aggregate,
+            kind,
+            width,
+            height,
+            options,
+            h,
+            max_cardinality,
+            limit,
+            drilldown,
+            stock,
+            alpha,
+        ]
+        # These charts do not depend on the 'aggregate' parameter, drawing
+        # them again with the opposite value would give the same error.
+        if drilldown or kind in (
+            "boxplot",
+            "bubble",
+            "scatter",
+            "pearson",
+            "kendall",
+            "cramer",
+            "biserial",
+            "spearman",
+        ):
+            return hchart_from_vdf(*params)
         try:
-            return hchart_from_vdf(
-                self,
-                x,
-                y,
-                z,
-                c,
-                aggregate,
-                kind,
-                width,
-                height,
-                options,
-                h,
-                max_cardinality,
-                limit,
-                drilldown,
-                stock,
-                alpha,
-            )
-        except:
-            return hchart_from_vdf(
-                self,
-                x,
-                y,
-                z,
-                c,
-                not (aggregate),
-                kind,
-                width,
-                height,
-                options,
-                h,
-                max_cardinality,
-                limit,
-                drilldown,
-                stock,
-                alpha,
-            )
+            return hchart_from_vdf(*params)
+        except Exception:
+            params[5] = not (aggregate)
+            return hchart_from_vdf(*params)
 
     # ---#
     def head(self, limit: int = 5):
@@ -5956,16 +6043,19 @@ vColumns : vColumn
                 ("h", h, [list],),
             ]
         )
-        columns_check(columns, self, [2])
-        columns = vdf_columns_names(columns, self)
-        if of:
-            columns_check([of], self)
-            of = vdf_columns_names([of], self)[0]
-        for column in columns:
-            assert self[column].isnum(), TypeError(f"vColumn {column} must be numerical to draw the Heatmap.")
+        columns, of = self.__format_columns__(columns, of, [2], "Heatmap")
         from verticapy.plot import pivot_table
 
-        min_max = self.agg(func=["min", "max"], columns=columns).transpose()
+        # The statistics needed by the pivot table (optimal h and cardinality)
+        # are computed together with the extent, the pivot table will then find
+        # them in the catalog instead of scanning the relation again.
+        if verticapy.options["cache"]:
+            if None in h:
+                self.describe(method="numerical", columns=columns, unique=False)
+            func = ["min", "max", "approx_unique"]
+        else:
+            func = ["min", "max"]
+        min_max = self.agg(func=func, columns=columns).transpose()
 
         ax = pivot_table(
             self,
@@ -5978,7 +6068,7 @@ vColumns : vColumn
             False,
             ax,
             True,
-            min_max[columns[0]] + min_max[columns[1]],
+            min_max[columns[0]][0:2] + min_max[columns[1]][0:2],
             **style_kwds,
         )
         return ax
@@ -5989,7 +6079,7 @@ vColumns : vColumn
         columns: list,
         method: str = "count",
         of: str = "",
-        bbox: list = [],
+        bbox: list = None,
         img: str = "",
         ax=None,
         **style_kwds,
@@ -6031,6 +6121,8 @@ vColumns : vColumn
     --------
     vDataFrame.pivot_table : Draws the pivot table of vColumns based on an aggregation.
         """
+        if bbox is None:
+            bbox = []
         if isinstance(method, str):
             method = method.lower()
         if isinstance(columns, str):
@@ -6044,11 +6136,7 @@ vColumns : vColumn
                 ("img", img, [str],),
             ]
         )
-        columns_check(columns, self, [2])
-        columns = vdf_columns_names(columns, self)
-        if of:
-            columns_check([of], self)
-            of = vdf_columns_names([of], self)[0]
+        columns, of = self.__format_columns__(columns, of, [2])
         from verticapy.plot import hexbin
 
         return hexbin(self, columns, method, of, bbox, img, ax=ax, **style_kwds,)
@@ -6125,15 +6213,11 @@ vColumns : vColumn
                 ("hist_type", hist_type, ["auto", "multi", "stacked"],),
             ]
         )
-        columns_check(columns, self, [1, 2, 3, 4, 5])
-        columns = vdf_columns_names(columns, self)
-        if of:
-            columns_check([of], self)
-            of = vdf_columns_names([of], self)[0]
+        columns, of = self.__format_columns__(columns, of, [1, 2, 3, 4, 5])
         stacked = True if (hist_type.lower() == "stacked") else False
         multi = True if (hist_type.lower() == "multi") else False
         if len(columns) == 1:
-            return self[columns[0]].hist(method, of, 6, 0, 0, **style_kwds,)
+            return getattr(self, columns[0]).hist(method, of, 6, 0, 0, **style_kwds,)
         else:
             if multi:
                 from verticapy.plot import multiple_hist
@@ -6202,19 +6286,20 @@ vColumns : vColumn
         columns = vdf_columns_names(columns, self)
         if not (columns):
             columns = self.get_columns()
-        all_columns = []
-        for column in columns:
-            all_columns += [
-                "{} AS {}".format(
-                    convert_special_type(self[column].category(), True, column), column
-                )
-            ]
+        # The names are already resolved, the vColumns can be accessed directly.
+        vcolumns = [getattr(self, column) for column in columns]
+        all_columns = ", ".join(
+            "{} AS {}".format(
+                convert_special_type(vcolumn.category(), True, column), column
+            )
+            for column, vcolumn in zip(columns, vcolumns)
+        )
         title = "Reads the final relation using a limit of {} and an offset of {}.".format(
             limit, offset
         )
         result = to_tablesample(
             "SELECT {} FROM {}{} LIMIT {} OFFSET {}".format(
-                ", ".join(all_columns),
+                all_columns,
                 self.__genSQL__(),
                 last_order_by(self),
                 limit,
@@ -6228,22 +6313,22 @@ vColumns : vColumn
             result.count = pre_comp
         result.offset = offset
         result.name = self._VERTICAPY_VARIABLES_["input_relation"]
-        columns = self.get_columns()
-        all_percent = True
-        for column in columns:
-            if not ("percent" in self[column].catalog):
-                all_percent = False
-        all_percent = (all_percent or (verticapy.options["percent_bar"] == True)) and (
-            verticapy.options["percent_bar"] != False
-        )
-        if all_percent:
-            percent = self.aggregate(["percent"], columns).transpose().values
-        for column in result.values:
-            result.dtype[column] = self[column].ctype()
+        missing_percent = [
+            column
+            for column, vcolumn in zip(columns, vcolumns)
+            if not ("percent" in vcolumn.catalog) or not (verticapy.options["cache"])
+        ]
+        all_percent = (
+            not (missing_percent) or (verticapy.options["percent_bar"] == True)
+        ) and (verticapy.options["percent_bar"] != False)
+        # Only the vColumns without a stored percent are aggregated, the
+        # aggregation fills their catalog.
+        if all_percent and missing_percent:
+            self.aggregate(["percent"], missing_percent)
+        for column, vcolumn in zip(result.values, vcolumns):
+            result.dtype[column] = vcolumn.ctype()
             if all_percent:
-                result.percent[column] = percent[vdf_columns_names([column], self)[0]][
-                    0
-                ]
+                result.percent[column] = vcolumn.catalog["percent"]
         return result
 
     # ---#
@@ -6257,16 +6342,14 @@ vColumns : vColumn
     str
         information on the vDataFrame modifications
         """
-        if len(self._VERTICAPY_VARIABLES_["history"]) == 0:
-            result = "The vDataFrame was never modified."
-        elif len(self._VERTICAPY_VARIABLES_["history"]) == 1:
+        history = self._VERTICAPY_VARIABLES_["history"]
+        if len(history) == 0:
+            return "The vDataFrame was never modified."
+        elif len(history) == 1:
             result = "The vDataFrame was modified with only one action: "
-            result += "\n * " + self._VERTICAPY_VARIABLES_["history"][0]
         else:
             result = "The vDataFrame was modified many times: "
-            for modif in self._VERTICAPY_VARIABLES_["history"]:
-                result += "\n * " + modif
-        return result
+        return result + "".join("\n * " + modif for modif in history)
 
     # ---#
     def isin(self, val: dict):
@@ -6291,18 +6374,41 @@ vColumns : vColumn
         check_types([("val", val, [dict],)])
         columns_check([elem for elem in val], self)
         n = len(val[list(val.keys())[0]])
-        result = []
-        for i in range(n):
-            tmp_query = []
-            for column in val:
-                if val[column][i] == None:
-                    tmp_query += [str_column(column) + " IS NULL"]
-                else:
-                    tmp_query += [
-                        str_column(column)
-                        + " = '{}'".format(str(val[column][i]).replace("'", "''"))
+        if len(val) == 1:
+            # A single vColumn is searched using one IN list instead of
+            # an OR chain of equalities.
+            column = list(val.keys())[0]
+            values = [
+                "'{}'".format(str(elem).replace("'", "''"))
+                for elem in val[column]
+                if elem != None
+            ]
+            result = []
+            if values:
+                result += ["{} IN ({})".format(str_column(column), ", ".join(values))]
+            if len(values) < n:
+                result += [str_column(column) + " IS NULL"]
+            return self.search(" OR ".join(result))
+        # One template is built per pattern of missing values, each record
+        # is then formatted in a single call.
+        columns = [
+            str_column(column).replace("{", "{{").replace("}", "}}") for column in val
+        ]
+        templates, result = {}, []
+        for record in zip(*[val[column] for column in val]):
+            nulls = tuple(elem == None for elem in record)
+            if nulls not in templates:
+                templates[nulls] = " AND ".join(
+                    [
+                        column + " IS NULL" if is_null else column + " = '{}'"
+                        for column, is_null in zip(columns, nulls)
                     ]
-            result += [" AND ".join(tmp_query)]
+                )
+            result += [
+                templates[nulls].format(
+                    *[str(elem).replace("'", "''") for elem in record if elem != None]
+                )
+            ]
         return self.search(" OR ".join(result))
 
     # ---#
@@ -6312,8 +6418,8 @@ vColumns : vColumn
         on: dict = {},
         on_interpolate: dict = {},
         how: str = "natural",
-        expr1: list = ["*"],
-        expr2: list = ["*"],
+        expr1: list = None,
+        expr2: list = None,
     ):
         """
     ---------------------------------------------------------------------------
@@ -6370,6 +6476,10 @@ vColumns : vColumn
     vDataFrame.groupby : Aggregates the vDataFrame.
     vDataFrame.sort    : Sorts the vDataFrame.
         """
+        if expr1 is None:
+            expr1 = ["*"]
+        if expr2 is None:
+            expr2 = ["*"]
         if isinstance(expr1, str):
             expr1 = [expr1]
         if isinstance(expr2, str):
@@ -6387,69 +6497,62 @@ vColumns : vColumn
                 ("input_relation", input_relation, [vDataFrame, str],),
             ]
         )
-        how = how.lower()
-        columns_check([elem for elem in on], self)
-        if isinstance(input_relation, vDataFrame):
-            columns_check([on[elem] for elem in on], input_relation)
-            vdf_cols = []
-            for elem in on:
-                vdf_cols += [on[elem]]
-            columns_check(vdf_cols, input_relation)
-            relation = input_relation.__genSQL__()
+
+        def relation_alias(relation: str, alias: str):
+            # The relation is uppercased once, it can be a very long query.
+            relation_upper = relation.upper()
             if (
-                ("SELECT" in relation.upper())
-                and ("FROM" in relation.upper())
+                ("SELECT" in relation_upper)
+                and ("FROM" in relation_upper)
                 and ("(" in relation)
                 and (")" in relation)
             ):
-                second_relation = "(SELECT * FROM {}) AS y".format(relation)
+                return "(SELECT * FROM {}) AS {}".format(relation, alias)
             else:
-                second_relation = "{} AS y".format(relation)
+                return "{} AS {}".format(relation, alias)
+
+        how = how.lower()
+        columns_check([elem for elem in on], self)
+        if isinstance(input_relation, vDataFrame):
+            columns_check([on[elem] for elem in on], input_relation)
+            second_relation = relation_alias(input_relation.__genSQL__(), "y")
         elif isinstance(input_relation, str):
-            if (
-                ("SELECT" in input_relation.upper())
-                and ("FROM" in input_relation.upper())
-                and ("(" in input_relation)
-                and (")" in input_relation)
-            ):
-                second_relation = "(SELECT * FROM {}) AS y".format(input_relation)
-            else:
-                second_relation = "{} AS y".format(input_relation)
+            second_relation = relation_alias(input_relation, "y")
         on_join = " AND ".join(
             [
-                'x."'
-                + elem.replace('"', "")
-                + '" = y."'
-                + on[elem].replace('"', "")
-                + '"'
+                'x."{}" = y."{}"'.format(elem.replace('"', ""), on[elem].replace('"', ""))
                 for elem in on
             ]
             + [
-                'x."'
-                + elem.replace('"', "")
-                + '" INTERPOLATE PREVIOUS VALUE y."'
-                + on_interpolate[elem].replace('"', "")
-                + '"'
+                'x."{}" INTERPOLATE PREVIOUS VALUE y."{}"'.format(
+                    elem.replace('"', ""), on_interpolate[elem].replace('"', "")
+                )
                 for elem in on_interpolate
             ]
         )
         on_join = " ON {}".format(on_join) if (on_join) else ""
-        relation = self.__genSQL__()
+        first_relation = relation_alias(self.__genSQL__(), "x")
+        expr = ["x.{}".format(elem) for elem in expr1] + [
+            "y.{}".format(elem) for elem in expr2
+        ]
+        expr = "*" if not (expr) else ", ".join(expr)
+        # For symmetric joins, the smallest relation is put first when both
+        # sizes are already known. The aliases stay the same so the final
+        # relation is unchanged. With 'SELECT *', the columns order follows
+        # the relations order, so they are not swapped.
         if (
-            ("SELECT" in relation.upper())
-            and ("FROM" in relation.upper())
-            and ("(" in relation)
-            and (")" in relation)
+            (expr != "*")
+            and (how in ("cross", "inner", "natural", ""))
+            and isinstance(input_relation, vDataFrame)
         ):
-            first_relation = "(SELECT * FROM {}) AS x".format(relation)
-        else:
-            first_relation = "{} AS x".format(relation)
-        expr1, expr2 = (
-            ["x.{}".format(elem) for elem in expr1],
-            ["y.{}".format(elem) for elem in expr2],
-        )
-        expr = expr1 + expr2
-        expr = "*" if not (expr) else ", ".join(expr)
+            count_x = self.__get_catalog_value__("VERTICAPY_COUNT")
+            count_y = input_relation.__get_catalog_value__("VERTICAPY_COUNT")
+            if (
+                (count_x != "VERTICAPY_NOT_PRECOMPUTED")
+                and (count_y != "VERTICAPY_NOT_PRECOMPUTED")
+                and (count_y < count_x)
+            ):
+                first_relation, second_relation = second_relation, first_relation
         table = "SELECT {} FROM {} {} JOIN {} {}".format(
             expr, first_relation, how.upper(), second_relation, on_join
         )
@@ -6547,7 +6650,12 @@ vColumns : vColumn
         """
         check_types([("offset", offset, [int, float],)])
         save = self._VERTICAPY_VARIABLES_["saving"][offset]
-        vdf = pickle.loads(save)
+        # The savings are structural copies, the pickled ones come from
+        # objects saved with previous versions.
+        if isinstance(save, vDataFrame):
+            vdf = save.copy()
+        else:
+            vdf = pickle.loads(save)
         vdf._VERTICAPY_VARIABLES_["cursor"] = self._VERTICAPY_VARIABLES_["cursor"]
         return vdf
 
@@ -6644,14 +6752,12 @@ vColumns : vColumn
         total = sum(
             [sys.getsizeof(elem) for elem in self._VERTICAPY_VARIABLES_]
         ) + sys.getsizeof(self)
-        values = {"index": ["object"], "value": [total]}
-        columns = [elem for elem in self._VERTICAPY_VARIABLES_["columns"]]
-        for column in columns:
-            values["index"] += [column]
-            values["value"] += [self[column].memory_usage()]
-            total += self[column].memory_usage()
-        values["index"] += ["total"]
-        values["value"] += [total]
+        columns = self._VERTICAPY_VARIABLES_["columns"]
+        memory_usage = [getattr(self, column).memory_usage() for column in columns]
+        values = {
+            "index": ["object"] + columns + ["total"],
+            "value": [total] + memory_usage + [total + sum(memory_usage)],
+        }
         return tablesample(values=values)
 
     # ---#
@@ -6724,35 +6830,47 @@ vColumns : vColumn
         columns = vdf_columns_names(columns, self)
         if not (columns):
             columns = self.numcol()
-        for idx in index:
-            if idx in columns:
-                columns.remove(idx)
-        query = []
-        all_are_num, all_are_date = True, True
-        for column in columns:
-            if not (self[column].isnum()):
-                all_are_num = False
-            if not (self[column].isdate()):
-                all_are_date = False
-        for column in columns:
-            conv = ""
-            if not (all_are_num) and not (all_are_num):
-                conv = "::varchar"
-            elif self[column].category() == "int":
-                conv = "::int"
-            query += [
-                "(SELECT {}, '{}' AS {}, {}{} AS {} FROM {})".format(
-                    ", ".join(index),
-                    column.replace("'", "''")[1:-1],
-                    col_name,
-                    column,
-                    conv,
-                    val_name,
-                    self.__genSQL__(),
-                )
+        index_set = set(index)
+        columns = [column for column in columns if column not in index_set]
+        all_are_num = all(getattr(self, column).isnum() for column in columns)
+        all_are_date = all(getattr(self, column).isdate() for column in columns)
+        if all_are_num:
+            convs = [
+                "::int" if getattr(self, column).category() == "int" else ""
+                for column in columns
+            ]
+        else:
+            convs = ["" if (all_are_date) else "::varchar"] * len(columns)
+        # Each row is repeated once per vColumn using a small cross join,
+        # the main relation is then scanned only once.
+        names = " ".join(
+            [
+                "WHEN {} THEN '{}'".format(i, column.replace("'", "''")[1:-1])
+                for i, column in enumerate(columns)
+            ]
+        )
+        values = " ".join(
+            [
+                "WHEN {} THEN {}{}".format(i, column, conv)
+                for i, (column, conv) in enumerate(zip(columns, convs))
             ]
-        query = " UNION ALL ".join(query)
-        query = "({}) VERTICAPY_SUBTABLE".format(query)
+        )
+        positions = " UNION ALL ".join(
+            ["SELECT {} AS verticapy_narrow_idx".format(i) for i in range(len(columns))]
+        )
+        query = (
+            "(SELECT {}, CASE verticapy_narrow_idx {} END AS {}, CASE "
+            "verticapy_narrow_idx {} END AS {} FROM {} CROSS JOIN ({}) "
+            "VERTICAPY_NARROW_COLUMNS) VERTICAPY_SUBTABLE"
+        ).format(
+            ", ".join(index),
+            names,
+            col_name,
+            values,
+            val_name,
+            self.__genSQL__(),
+            positions,
+        )
         return self.__vdf_from_relation__(
             query, "narrow", "[Narrow]: Narrow table using index = {}".format(index),
         )
@@ -6801,6 +6919,21 @@ vColumns : vColumn
         columns_check(columns, self)
         no_cols = True if not (columns) else False
         columns = self.numcol() if not (columns) else vdf_columns_names(columns, self)
+        # The statistics of all the vColumns are computed in one query, each
+        # vColumn normalization then reads them from the catalog.
+        if verticapy.options["cache"]:
+            func = {
+                "zscore": ["avg", "std"],
+                "robust_zscore": ["mad", "median"],
+                "minmax": ["min", "max"],
+            }[method]
+            num_columns = [
+                column
+                for column in columns
+                if self[column].isnum() and not (self[column].isbool())
+            ]
+            if num_columns:
+                self.aggregate(func=func, columns=num_columns)
         for column in columns:
             if self[column].isnum() and not (self[column].isbool()):
                 self[column].normalize(method=method)
@@ -6834,11 +6967,11 @@ vColumns : vColumn
     vDataFrame.catcol      : Returns the categorical type vColumns in the vDataFrame.
     vDataFrame.get_columns : Returns the vColumns of the vDataFrame.
         """
-        columns, cols = [], self.get_columns(exclude_columns=exclude_columns)
-        for column in cols:
-            if self[column].isnum():
-                columns += [column]
-        return columns
+        return [
+            column
+            for column in self.get_columns(exclude_columns=exclude_columns)
+            if getattr(self, column).isnum()
+        ]
 
     # ---#
     def nunique(self, columns: list = []):
@@ -6916,17 +7049,17 @@ vColumns : vColumn
         conditions = []
         for idx, elem in enumerate(result["index"]):
             if not (robust):
-                conditions += [
+                conditions.append(
                     "ABS({} - {}) / NULLIFZERO({}) > {}".format(
                         elem, result["avg"][idx], result["std"][idx], threshold
                     )
-                ]
+                )
             else:
-                conditions += [
+                conditions.append(
                     "ABS({} - {}) / NULLIFZERO({} * 1.4826) > {}".format(
                         elem, result["median"][idx], result["mad"][idx], threshold
                     )
-                ]
+                )
         self.eval(
             name, "(CASE WHEN {} THEN 1 ELSE 0 END)".format(" OR ".join(conditions))
         )
@@ -7086,6 +7219,18 @@ vColumns : vColumn
                 return 1.0
             elif p == 1:
                 return self.acf(ts=ts, column=column, by=by, p=[1], unit=unit)
+            return self.pacf(
+                ts=ts,
+                column=column,
+                by=by,
+                p=[0, p],
+                unit=unit,
+                confidence=False,
+                show=False,
+            )["value"][1]
+        else:
+            if isinstance(p, (float, int)):
+                p = range(0, p + 1)
             columns_check([column, ts] + by, self)
             by = vdf_columns_names(by, self)
             column = vdf_columns_names([column], self)[0]
@@ -7097,131 +7242,106 @@ vColumns : vColumn
                     ts=ts, rule="1 {}".format(unit), method={column: "linear"}, by=by
                 ).__genSQL__()
             by = "PARTITION BY {} ".format(", ".join(by)) if (by) else ""
+            column_name = gen_name([column])
+            lags = [column] + [
+                "lag_{}_{}".format(i, column_name) for i in range(1, max(p) + 1)
+            ]
+            # The series is centered to keep the sums of products accurate.
             columns = [
-                "LAG({}, {}) OVER ({}ORDER BY {}) AS lag_{}_{}".format(
-                    column, i, by, ts, i, gen_name([column])
+                "LAG({}, {}) OVER ({}ORDER BY {}) - AVG({}) OVER () AS {}".format(
+                    column, i, by, ts, column, lags[i]
                 )
-                for i in range(1, p + 1)
+                for i in range(1, max(p) + 1)
             ]
-            relation = "(SELECT {} FROM {}) pacf".format(
-                ", ".join([column] + columns), table
+            relation = "(SELECT {} - AVG({}) OVER () AS {}, {} FROM {}) pacf".format(
+                column, column, column, ", ".join(columns), table
             )
-            schema = self._VERTICAPY_VARIABLES_["schema_writing"]
-            if not (schema):
-                schema = "public"
-
-            def drop_temp_elem(self, schema):
-                try:
-                    with warnings.catch_warnings(record=True) as w:
-                        drop(
-                            "{}.VERTICAPY_TEMP_MODEL_LINEAR_REGRESSION_{}".format(
-                                schema,
-                                get_session(self._VERTICAPY_VARIABLES_["cursor"]),
-                            ),
-                            cursor=self._VERTICAPY_VARIABLES_["cursor"],
-                            method="model",
-                        )
-                        drop(
-                            "{}.VERTICAPY_TEMP_MODEL_LINEAR_REGRESSION2_{}".format(
-                                schema,
-                                get_session(self._VERTICAPY_VARIABLES_["cursor"]),
-                            ),
-                            cursor=self._VERTICAPY_VARIABLES_["cursor"],
-                            method="model",
-                        )
-                        drop(
-                            "{}.VERTICAPY_TEMP_MODEL_LINEAR_REGRESSION_VIEW_{}".format(
-                                schema,
-                                get_session(self._VERTICAPY_VARIABLES_["cursor"]),
-                            ),
-                            cursor=self._VERTICAPY_VARIABLES_["cursor"],
-                            method="view",
-                        )
-                except:
-                    pass
-
-            try:
-                drop_temp_elem(self, schema)
-                query = "CREATE VIEW {}.VERTICAPY_TEMP_MODEL_LINEAR_REGRESSION_VIEW_{} AS SELECT * FROM {}".format(
-                    schema, get_session(self._VERTICAPY_VARIABLES_["cursor"]), relation
-                )
-                self._VERTICAPY_VARIABLES_["cursor"].execute(query)
-                vdf = vDataFrame(
-                    "{}.VERTICAPY_TEMP_MODEL_LINEAR_REGRESSION_VIEW_{}".format(
-                        schema, get_session(self._VERTICAPY_VARIABLES_["cursor"])
-                    ),
-                    self._VERTICAPY_VARIABLES_["cursor"],
-                )
-
-                from verticapy.learn.linear_model import LinearRegression
-
-                model = LinearRegression(
-                    name="{}.VERTICAPY_TEMP_MODEL_LINEAR_REGRESSION_{}".format(
-                        schema, get_session(self._VERTICAPY_VARIABLES_["cursor"])
-                    ),
-                    cursor=self._VERTICAPY_VARIABLES_["cursor"],
-                    solver="Newton",
-                )
-                model.fit(
-                    input_relation="{}.VERTICAPY_TEMP_MODEL_LINEAR_REGRESSION_VIEW_{}".format(
-                        schema, get_session(self._VERTICAPY_VARIABLES_["cursor"])
+            # The partial autocorrelation of lag k is the correlation between
+            # the residuals of the regressions of the vColumn and of its k-th
+            # lag on the lags in between. It is computed using the covariance
+            # matrix of the k + 1 first lags on the rows where they are all
+            # defined. These rows are the ones having at least k defined
+            # consecutive lags: the sums needed by all the matrices are
+            # computed by number of defined lags in a single query, and each
+            # matrix is built from the sums of the groups it includes.
+            max_lag = max(p)
+            import numpy as np
+
+            count = np.zeros(max_lag + 2)
+            sums = np.zeros((max_lag + 2, max_lag + 1))
+            products = np.zeros((max_lag + 2, max_lag + 1, max_lag + 1))
+            if max_lag > 0:
+                nlag = "CASE {} ELSE {} END".format(
+                    " ".join(
+                        "WHEN {} IS NULL THEN {}".format(lags[i], i - 1)
+                        for i in range(1, max_lag + 1)
                     ),
-                    X=["lag_{}_{}".format(i, gen_name([column])) for i in range(1, p)],
-                    y=column,
+                    max_lag,
                 )
-                model.predict(vdf, name="prediction_0")
-                model = LinearRegression(
-                    name="{}.VERTICAPY_TEMP_MODEL_LINEAR_REGRESSION2_{}".format(
-                        schema, get_session(self._VERTICAPY_VARIABLES_["cursor"])
-                    ),
-                    cursor=self._VERTICAPY_VARIABLES_["cursor"],
-                    solver="Newton",
-                )
-                model.fit(
-                    input_relation="{}.VERTICAPY_TEMP_MODEL_LINEAR_REGRESSION_VIEW_{}".format(
-                        schema, get_session(self._VERTICAPY_VARIABLES_["cursor"])
-                    ),
-                    X=["lag_{}_{}".format(i, gen_name([column])) for i in range(1, p)],
-                    y="lag_{}_{}".format(p, gen_name([column])),
-                )
-                model.predict(vdf, name="prediction_p")
-                vdf.eval(expr="{} - prediction_0".format(column), name="eps_0")
-                vdf.eval(
-                    expr="{} - prediction_p".format(
-                        "lag_{}_{}".format(p, gen_name([column]))
+                aggr = ["COUNT(*)"]
+                aggr += ["SUM({})".format(elem) for elem in lags]
+                aggr += [
+                    "SUM({} * {})".format(lags[i], lags[j])
+                    for i in range(max_lag + 1)
+                    for j in range(i, max_lag + 1)
+                ]
+                query_result = self.__executeSQL__(
+                    "SELECT {}, {} FROM {} WHERE {} IS NOT NULL GROUP BY 1".format(
+                        nlag, ", ".join(aggr), relation, column
                     ),
-                    name="eps_p",
-                )
-                result = vdf.corr(["eps_0", "eps_p"])
-                drop_temp_elem(self, schema)
-            except:
-                drop_temp_elem(self, schema)
-                raise
-            return result
-        else:
-            if isinstance(p, (float, int)):
-                p = range(0, p + 1)
-            if verticapy.options["tqdm"]:
-                from tqdm.auto import tqdm
-
-                loop = tqdm(p)
-            else:
-                loop = p
+                    title="Computes the lags sums of products.",
+                ).fetchall()
+                for row in query_result:
+                    # Sums including undefined lags are NULL: they are never
+                    # used by the matrices of the group.
+                    row = [0.0 if elem == None else float(elem) for elem in row]
+                    idx = int(row[0])
+                    count[idx] = row[1]
+                    sums[idx] = row[2 : max_lag + 3]
+                    values = iter(row[max_lag + 3 :])
+                    for i in range(max_lag + 1):
+                        for j in range(i, max_lag + 1):
+                            products[idx][i][j] = next(values)
+                            products[idx][j][i] = products[idx][i][j]
+                count = np.cumsum(count[::-1])[::-1]
+                sums = np.cumsum(sums[::-1], axis=0)[::-1]
+                products = np.cumsum(products[::-1], axis=0)[::-1]
             pacf = []
-            for i in loop:
-                pacf += [self.pacf(ts=ts, column=column, by=by, p=[i], unit=unit)]
+            for k in p:
+                if k == 0:
+                    pacf += [1.0]
+                    continue
+                # A constant or too short series leads to an undefined or a
+                # singular matrix: the partial autocorrelation is then NaN.
+                value = float("nan")
+                if count[k] > 1:
+                    cov = (
+                        products[k][0 : k + 1, 0 : k + 1]
+                        - np.outer(sums[k][0 : k + 1], sums[k][0 : k + 1]) / count[k]
+                    ) / (count[k] - 1)
+                    try:
+                        precision = np.linalg.inv(cov)
+                        den = precision[0][0] * precision[k][k]
+                        if den > 0:
+                            value = float(-precision[0][k] / math.sqrt(den))
+                    except np.linalg.LinAlgError:
+                        pass
+                pacf += [value]
             columns = [elem for elem in p]
             pacf_band = []
             if confidence:
                 from scipy.special import erfinv
 
-                for k in range(1, len(pacf) + 1):
-                    pacf_band += [
-                        math.sqrt(2)
-                        * erfinv(alpha)
-                        / math.sqrt(self[column].count() - k + 1)
-                        * math.sqrt((1 + 2 * sum([pacf[i] ** 2 for i in range(1, k)])))
-                    ]
+                # The k-th band uses the sum of the k - 1 first squared lags.
+                squares_sum = np.cumsum([0.0] + [elem ** 2 for elem in pacf[1:]])
+                pacf_band = (
+                    math.sqrt(2)
+                    * erfinv(alpha)
+                    * np.sqrt(
+                        (1 + 2 * squares_sum)
+                        / (self[column].count() - np.arange(1, len(pacf) + 1) + 1)
+                    )
+                ).tolist()
             result = tablesample({"index": columns, "value": pacf})
             if pacf_band:
                 result.values["confidence"] = pacf_band
@@ -7299,6 +7419,7 @@ vColumns : vColumn
         values: str,
         aggr: str = "sum",
         prefix: str = "",
+        categories: list = [],
     ):
         """
     ---------------------------------------------------------------------------
@@ -7319,6 +7440,9 @@ vColumns : vColumn
         aggregation: x -> MAX(x) - MIN(x), write "MAX({}) - MIN({})".
     prefix: str, optional
         The prefix for the pivot table's column names.
+    categories: list, optional
+        List of the 'columns' categories to use as the pivot table's columns. 
+        If empty, the distinct categories of 'columns' will be computed.
 
     Returns
     -------
@@ -7338,6 +7462,7 @@ vColumns : vColumn
                 ("values", values, [str],),
                 ("aggr", aggr, [str],),
                 ("prefix", prefix, [str],),
+                ("categories", categories, [list],),
             ]
         )
         index = vdf_columns_names([index], self)[0]
@@ -7346,7 +7471,7 @@ vColumns : vColumn
         aggr = aggr.upper()
         if "{}" not in aggr:
             aggr += "({})"
-        new_cols = self[columns].distinct()
+        new_cols = categories if (categories) else self[columns].distinct()
         new_cols_trans = []
         for elem in new_cols:
             if elem == None:
@@ -7578,11 +7703,32 @@ vColumns : vColumn
             numcol = self.numcol()
         else:
             numcol = vdf_columns_names(columns, self)
+        all_comb = list(combinations_with_replacement(numcol, r=r))
+        if not (all_comb):
+            return self.copy()
+        names = [str_column("_".join(elem).replace('"', "")) for elem in all_comb]
+        exprs = [" * ".join(elem) for elem in all_comb]
+        all_cols = self.get_columns()
+        for name in names:
+            assert not(column_check_ambiguous(name, all_cols)), NameError(f"A vColumn has already the alias of one of the polynomial combinations ({name}).\nIt can be the result of using previously the method on the same vColumns.\nBy renaming the conflicting vColumn, you'll be able to solve this issue.")
+        # The types of all the products are found using a single query.
+        query = "SELECT {} FROM {} LIMIT 0".format(
+            ", ".join(
+                ["{} AS {}".format(expr, name) for expr, name in zip(exprs, names)]
+            ),
+            self.__genSQL__(),
+        )
+        try:
+            ctypes = get_data_types(query, self._VERTICAPY_VARIABLES_["cursor"])
+        except:
+            ctypes = get_data_types(
+                query,
+                self._VERTICAPY_VARIABLES_["cursor"],
+                schema_writing=self._VERTICAPY_VARIABLES_["schema_writing"],
+            )
         vdf = self.copy()
-        all_comb = combinations_with_replacement(numcol, r=r)
-        for elem in all_comb:
-            name = "_".join(elem)
-            vdf.eval(name.replace('"', ""), expr=" * ".join(elem))
+        for name, expr, ctype in zip(names, exprs, ctypes):
+            vdf.__add_vcolumn__(name, expr, ctype[1])
         return vdf
 
     # ---#
@@ -7718,7 +7864,7 @@ vColumns : vColumn
         )
         columns_check([unique_id, item_id], self)
         unique_id, item_id = vdf_columns_names([unique_id, item_id], self)
-        vdf = self.copy()
+        vdf = self
         assert method == "count" or rating, f"Method '{method}' can not be used if parameter 'rating' is empty."
         if rating:
             assert isinstance(rating, str) or len(rating) == 3, ParameterError(f"Parameter 'rating' must be of type str or composed of exactly 3 elements: (r_vdf, r_item_id, r_name).")
@@ -7857,19 +8003,18 @@ vColumns : vColumn
         )
         columns_check([column], self)
         column = vdf_columns_names([column], self)[0]
-        expr = "REGEXP_{}({}, '{}'".format(
-            method.upper(), column, pattern.replace("'", "''")
-        )
-        if method in ("replace"):
-            expr += ", '{}'".format(replacement.replace("'", "''"))
-        if method in ("count", "instr", "replace", "substr"):
-            expr += ", {}".format(position)
-        if method in ("instr", "replace", "substr"):
-            expr += ", {}".format(occurrence)
-        if method in ("instr"):
-            expr += ", {}".format(return_position)
-        expr += ")"
-        gen_name([method, column])
+        args = [column, "'{}'".format(pattern.replace("'", "''"))]
+        if method == "replace":
+            args += ["'{}'".format(replacement.replace("'", "''"))]
+        args += {
+            "count": [position],
+            "instr": [position, occurrence, return_position],
+            "replace": [position, occurrence],
+            "substr": [position, occurrence],
+        }.get(method, [])
+        expr = "REGEXP_{}({})".format(method.upper(), ", ".join(map(str, args)))
+        if not (name):
+            name = gen_name([method, column])
         return self.eval(name=name, expr=expr)
 
     # ---#
@@ -7962,15 +8107,24 @@ vColumns : vColumn
             assert columns, EmptyParameter("No numerical column found in the vDataFrame.")
         columns_check(columns, self)
         columns = vdf_columns_names(columns, self)
-        columns = vdf_columns_names(columns, self)
         for column in columns:
             assert self[column].isnum(), TypeError(f"vColumn {column} must be numerical to compute the Regression Matrix.")
         n = len(columns)
-        all_list, nb_precomputed = [], 0
+        casts = [
+            "::int" if (getattr(self, column).isbool()) else "" for column in columns
+        ]
+        # REGR_COUNT and REGR_SXY do not depend on the order of their
+        # arguments, only the upper triangle of the matrix is computed.
+        symmetric = method in ("regr_count", "regr_sxy")
+        all_list, nb_precomputed, pairs, positions = [], 0, [], {}
         for i in range(0, n):
             for j in range(0, n):
-                cast_i = "::int" if (self[columns[i]].isbool()) else ""
-                cast_j = "::int" if (self[columns[j]].isbool()) else ""
+                if symmetric and (j < i):
+                    positions[(i, j)] = positions[(j, i)]
+                    continue
+                positions[(i, j)] = len(all_list)
+                pairs += [(i, j)]
+                cast_i, cast_j = casts[i], casts[j]
                 pre_comp_val = self.__get_catalog_value__(
                     method=method, columns=[columns[i], columns[j]]
                 )
@@ -7986,7 +8140,7 @@ vColumns : vColumn
                         )
                     ]
         try:
-            if nb_precomputed == n * n:
+            if nb_precomputed == len(all_list):
                 self._VERTICAPY_VARIABLES_["cursor"].execute(
                     "SELECT {}".format(", ".join(all_list))
                 )
@@ -8003,34 +8157,51 @@ vColumns : vColumn
         except:
             n = len(columns)
             result = []
-            for i in range(0, n):
-                for j in range(0, n):
+            # The aggregations are computed by blocks of 100. Only the blocks
+            # which fail are computed one aggregation at a time.
+            for k in range(0, len(pairs), 100):
+                aggr = [
+                    "{}({}{}, {}{})".format(
+                        method.upper(), columns[i], casts[i], columns[j], casts[j]
+                    )
+                    for i, j in pairs[k : k + 100]
+                ]
+                try:
                     self.__executeSQL__(
-                        query="SELECT {}({}{}, {}{}) FROM {}".format(
-                            method.upper(),
-                            columns[i],
-                            cast_i,
-                            columns[j],
-                            cast_j,
-                            self.__genSQL__(),
+                        query="SELECT {} FROM {}".format(
+                            ", ".join(aggr), self.__genSQL__()
                         ),
-                        title="Computes the {} aggregation, one at a time.".format(
+                        title="Computes the {} aggregations by blocks.".format(
                             method.upper()
                         ),
                     )
-                    result += [self._VERTICAPY_VARIABLES_["cursor"].fetchone()[0]]
-        matrix = [[1 for i in range(0, n + 1)] for i in range(0, n + 1)]
-        matrix[0] = [""] + columns
-        for i in range(0, n + 1):
-            matrix[i][0] = columns[i - 1]
-        k = 0
-        for i in range(0, n):
+                    result += [
+                        elem for elem in self._VERTICAPY_VARIABLES_["cursor"].fetchone()
+                    ]
+                except:
+                    for elem in aggr:
+                        self.__executeSQL__(
+                            query="SELECT {} FROM {}".format(elem, self.__genSQL__()),
+                            title="Computes the {} aggregation, one at a time.".format(
+                                method.upper()
+                            ),
+                        )
+                        result += [self._VERTICAPY_VARIABLES_["cursor"].fetchone()[0]]
+        values = {"index": [column for column in columns]}
+        for i, column1 in enumerate(columns):
+            values[column1] = []
             for j in range(0, n):
-                current = result[k]
-                k += 1
+                current = result[positions[(i, j)]]
                 if current == None:
                     current = float("nan")
-                matrix[i + 1][j + 1] = current
+                elif isinstance(current, decimal.Decimal):
+                    current = float(current)
+                values[column1] += [current]
+            self.__update_catalog__(
+                values=dict(zip(columns, values[column1])),
+                matrix=method,
+                column=column1,
+            )
         if show:
             from verticapy.plot import cmatrix
 
@@ -8040,6 +8211,9 @@ vColumns : vColumn
                 method_title = "Alpha"
             else:
                 method_title = method
+            matrix = [[""] + columns] + [
+                [column] + values[column] for column in columns
+            ]
             cmatrix(
                 matrix,
                 columns,
@@ -8052,21 +8226,6 @@ vColumns : vColumn
                 ax=ax,
                 **style_kwds,
             )
-        values = {"index": matrix[0][1 : len(matrix[0])]}
-        del matrix[0]
-        for column in matrix:
-            values[column[0]] = column[1 : len(column)]
-        for elem in values:
-            if elem != "index":
-                for idx in range(len(values[elem])):
-                    if isinstance(values[elem][idx], decimal.Decimal):
-                        values[elem][idx] = float(values[elem][idx])
-        for column1 in values:
-            if column1 != "index":
-                val = {}
-                for idx, column2 in enumerate(values["index"]):
-                    val[column2] = values[column1][idx]
-                self.__update_catalog__(values=val, matrix=method, column=column1)
         return tablesample(values=values)
 
     # ---#
@@ -8171,14 +8330,10 @@ vColumns : vColumn
                     rule[idx] = "PRECEDING" if idx == 0 else "FOLLOWING"
                     window[idx] = "UNBOUNDED"
                 else:
-                    nb_min = 0
-                    for i, char in enumerate(window[idx]):
-                        if char == "-":
-                            nb_min += 1
-                        elif char != " ":
-                            break
+                    interval = window[idx].lstrip("- ")
+                    nb_min = window[idx][0 : len(window[idx]) - len(interval)].count("-")
                     rule[idx] = "PRECEDING" if nb_min % 2 == 1 else "FOLLOWING"
-                    window[idx] = "'" + window[idx][i:] + "'"
+                    window[idx] = "'" + interval + "'"
                     method = "range"
             elif isinstance(w, (datetime.timedelta)):
                 rule[idx] = (
@@ -8189,8 +8344,6 @@ vColumns : vColumn
             else:
                 rule[idx] = "PRECEDING" if int(window[idx]) < 0 else "FOLLOWING"
                 window[idx] = abs(int(window[idx]))
-        if isinstance(columns, str):
-            columns = [columns]
         columns_check(columns + by + [elem for elem in order_by], self)
         if not (name):
             name = "moving_{}".format(
@@ -8206,79 +8359,54 @@ vColumns : vColumn
             else sort_str(order_by, self)
         )
         func = str_function(func.lower(), method="vertica")
-        windows_frame = " OVER ({}{} {} BETWEEN {} AND {})".format(
-            by,
-            order_by,
+        windows_frame = " OVER ({} {} BETWEEN {} {} AND {} {})".format(
+            " ".join(elem for elem in [by, order_by.strip()] if elem),
             method.upper(),
-            "{} {}".format(window[0], rule[0]),
-            "{} {}".format(window[1], rule[1]),
+            window[0],
+            rule[0],
+            window[1],
+            rule[1],
         )
-        all_cols = [
-            elem.replace('"', "").lower()
-            for elem in self._VERTICAPY_VARIABLES_["columns"]
-        ]
         if func in ("kurtosis", "skewness", "aad", "prod", "jb"):
             if func in ("skewness", "kurtosis", "aad", "jb"):
-                mean_name = "{}_mean_{}".format(
-                    columns[0].replace('"', ""), random.randint(0, 10000000)
-                ).lower()
-                std_name = "{}_std_{}".format(
-                    columns[0].replace('"', ""), random.randint(0, 10000000)
-                ).lower()
-                count_name = "{}_count_{}".format(
-                    columns[0].replace('"', ""), random.randint(0, 10000000)
-                ).lower()
-                self.eval(mean_name, "AVG({}){}".format(columns[0], windows_frame))
+                column_name = columns[0].replace('"', "").lower()
+                mean_name = "{}_mean_{}".format(column_name, gen_tmp_id())
+                std_name = "{}_std_{}".format(column_name, gen_tmp_id())
+                count_name = "{}_count_{}".format(column_name, gen_tmp_id())
+                # The helper windows have known types, so they are added
+                # without type query: the final expression validates them.
+                history_len = len(self._VERTICAPY_VARIABLES_["history"])
+                self.__add_vcolumn__(
+                    str_column(mean_name),
+                    "AVG({}){}".format(columns[0], windows_frame),
+                    "float",
+                )
                 if func != "aad":
-                    self.eval(
-                        std_name, "STDDEV({}){}".format(columns[0], windows_frame)
+                    self.__add_vcolumn__(
+                        str_column(std_name),
+                        "STDDEV({}){}".format(columns[0], windows_frame),
+                        "float",
                     )
-                    self.eval(
-                        count_name, "COUNT({}){}".format(columns[0], windows_frame)
+                    self.__add_vcolumn__(
+                        str_column(count_name),
+                        "COUNT({}){}".format(columns[0], windows_frame),
+                        "int",
                     )
-                if func == "kurtosis":
-                    expr = "AVG(POWER(({} - {}) / NULLIFZERO({}), 4))# * POWER({}, 2) * ({} + 1) / NULLIFZERO(({} - 1) * ({} - 2) * ({} - 3)) - 3 * POWER({} - 1, 2) / NULLIFZERO(({} - 2) * ({} - 3))".format(
-                        columns[0],
-                        mean_name,
-                        std_name,
-                        count_name,
-                        count_name,
-                        count_name,
-                        count_name,
-                        count_name,
-                        count_name,
-                        count_name,
-                        count_name,
+                if func in ("skewness", "jb"):
+                    skewness = "AVG(POWER(({0} - {1}) / NULLIFZERO({2}), 3))# * POWER({3}, 2) / NULLIFZERO(({3} - 1) * ({3} - 2))".format(
+                        columns[0], mean_name, std_name, count_name
                     )
-                elif func == "skewness":
-                    expr = "AVG(POWER(({} - {}) / NULLIFZERO({}), 3))# * POWER({}, 2) / NULLIFZERO(({} - 1) * ({} - 2))".format(
-                        columns[0],
-                        mean_name,
-                        std_name,
-                        count_name,
-                        count_name,
-                        count_name,
+                if func in ("kurtosis", "jb"):
+                    kurtosis = "AVG(POWER(({0} - {1}) / NULLIFZERO({2}), 4))# * POWER({3}, 2) * ({3} + 1) / NULLIFZERO(({3} - 1) * ({3} - 2) * ({3} - 3)) - 3 * POWER({3} - 1, 2) / NULLIFZERO(({3} - 2) * ({3} - 3))".format(
+                        columns[0], mean_name, std_name, count_name
                     )
+                if func == "kurtosis":
+                    expr = kurtosis
+                elif func == "skewness":
+                    expr = skewness
                 elif func == "jb":
-                    expr = "{} / 6 * (POWER(AVG(POWER(({} - {}) / NULLIFZERO({}), 3))# * POWER({}, 2) / NULLIFZERO(({} - 1) * ({} - 2)), 2) + POWER(AVG(POWER(({} - {}) / NULLIFZERO({}), 4))# * POWER({}, 2) * ({} + 1) / NULLIFZERO(({} - 1) * ({} - 2) * ({} - 3)) - 3 * POWER({} - 1, 2) / NULLIFZERO(({} - 2) * ({} - 3)), 2) / 4)".format(
-                        count_name,
-                        columns[0],
-                        mean_name,
-                        std_name,
-                        count_name,
-                        count_name,
-                        count_name,
-                        columns[0],
-                        mean_name,
-                        std_name,
-                        count_name,
-                        count_name,
-                        count_name,
-                        count_name,
-                        count_name,
-                        count_name,
-                        count_name,
-                        count_name,
+                    expr = "{} / 6 * (POWER({}, 2) + POWER({}, 2) / 4)".format(
+                        count_name, skewness, kurtosis
                     )
                 elif func == "aad":
                     expr = "AVG(ABS({} - {}))#".format(columns[0], mean_name)
@@ -8311,7 +8439,23 @@ vColumns : vColumn
         else:
             expr = "{}({})#".format(func.upper(), columns[0])
         expr = expr.replace("#", windows_frame)
-        self.eval(name=name, expr=expr)
+        try:
+            self.eval(name=name, expr=expr)
+        except:
+            # The helpers were not type checked: they are removed, with their
+            # history, to keep the vDataFrame usable.
+            if func in ("kurtosis", "skewness", "jb", "aad"):
+                helpers = (
+                    [mean_name]
+                    if (func == "aad")
+                    else [mean_name, std_name, count_name]
+                )
+                for elem in helpers:
+                    self._VERTICAPY_VARIABLES_["columns"].remove(str_column(elem))
+                    delattr(self, str_column(elem))
+                    delattr(self, elem)
+                del self._VERTICAPY_VARIABLES_["history"][history_len:]
+            raise
         if func in ("kurtosis", "skewness", "jb"):
             self._VERTICAPY_VARIABLES_["exclude_columns"] += [
                 str_column(mean_name),
@@ -8383,8 +8527,6 @@ vColumns : vColumn
             by = [by]
         columns_check(by, self)
         by = vdf_columns_names(by, self)
-        name = "__verticapy_random_{}__".format(random.randint(0, 10000000))
-        vdf = self.copy()
         assert (0 < x < 1), ParameterError("Parameter 'x' must be between 0 and 1")
         if method == "random":
             random_state = verticapy.options["random_state"]
@@ -8393,17 +8535,13 @@ vColumns : vColumn
                 if isinstance(random_state, int)
                 else random.randint(-10e6, 10e6)
             )
-            random_func = "SEEDED_RANDOM({})".format(random_seed)
-            vdf.eval(name, random_func)
-            print_info_init = verticapy.options["print_info"]
-            verticapy.options["print_info"] = False
-            vdf.filter("{} < {}".format(name, x),)
-            verticapy.options["print_info"] = print_info_init
-            vdf._VERTICAPY_VARIABLES_["exclude_columns"] += [name]
+            return self.search("SEEDED_RANDOM({}) < {}".format(random_seed, x))
         elif method in ("stratified", "systematic"):
             assert method != "stratified" or (by), ParameterError("Parameter 'by' must include at least one column when using 'stratified' sampling.")
             if method == "stratified":
                 order_by = "ORDER BY " + ", ".join(by)
+            name = "__verticapy_random_{}__".format(gen_tmp_id())
+            vdf = self.copy()
             vdf.eval(name, "ROW_NUMBER() OVER({})".format(order_by))
             print_info_init = verticapy.options["print_info"]
             verticapy.options["print_info"] = False
@@ -8430,7 +8568,7 @@ vColumns : vColumn
         """
         vdf = self.copy()
         vdf._VERTICAPY_VARIABLES_["cursor"] = None
-        self._VERTICAPY_VARIABLES_["saving"] += [pickle.dumps(vdf)]
+        self._VERTICAPY_VARIABLES_["saving"] += [vdf]
         return self
 
     # ---#
@@ -8592,7 +8730,8 @@ vColumns : vColumn
         Filters of the search. It can be a list of conditions or an expression.
     usecols: list, optional
         vColumns to select from the final vDataFrame relation. If empty, all
-        vColumns will be selected.
+        vColumns will be selected. When 'expr' is empty, they are selected in
+        the same query as the filter.
     expr: list, optional
         List of customized expressions in pure SQL.
         For example: 'column1 * column2 AS my_name'.
@@ -8628,7 +8767,21 @@ vColumns : vColumn
         if isinstance(conditions, Iterable) and not (isinstance(conditions, str)):
             conditions = " AND ".join(["({})".format(elem) for elem in conditions])
         conditions = " WHERE {}".format(conditions) if conditions else ""
-        all_cols = ", ".join(["*"] + expr)
+        if usecols and not (expr):
+            # No alias to resolve: the projection is done in the same query.
+            vdf_columns = {
+                str_column(column).lower(): str_column(column)
+                for column in reversed(self.get_columns())
+            }
+            all_cols = ", ".join(
+                [
+                    vdf_columns.get(str_column(column).lower(), str(column))
+                    for column in usecols
+                ]
+            )
+            usecols = []
+        else:
+            all_cols = ", ".join(["*"] + expr)
         table = "(SELECT {} FROM {}{}) VERTICAPY_SUBTABLE".format(
             all_cols, self.__genSQL__(), conditions
         )
@@ -8662,12 +8815,14 @@ vColumns : vColumn
         if isinstance(columns, str):
             columns = [columns]
         check_types([("columns", columns, [list],)])
-        for i in range(len(columns)):
-            column = vdf_columns_names([columns[i]], self)
-            if column:
-                columns[i] = column[0]
-            else:
-                columns[i] = str(columns[i])
+        vdf_columns = {
+            str_column(column).lower(): str_column(column)
+            for column in reversed(self.get_columns())
+        }
+        columns = [
+            vdf_columns.get(str_column(column).lower(), str(column))
+            for column in columns
+        ]
         table = "(SELECT {} FROM {}) VERTICAPY_SUBTABLE".format(
             ", ".join(columns), self.__genSQL__()
         )
@@ -9123,9 +9278,8 @@ vColumns : vColumn
         check_types([("columns", columns, [dict, list],)])
         columns_check([elem for elem in columns], self)
         max_pos = 0
-        columns_tmp = [elem for elem in self._VERTICAPY_VARIABLES_["columns"]]
-        for column in columns_tmp:
-            max_pos = max(max_pos, len(self[column].transformations) - 1)
+        for column in self._VERTICAPY_VARIABLES_["columns"]:
+            max_pos = max(max_pos, len(getattr(self, column).transformations) - 1)
         self._VERTICAPY_VARIABLES_["order_by"][max_pos] = sort_str(columns, self)
         return self
 
@@ -9272,12 +9426,13 @@ vColumns : vColumn
         check_types(
             [("column1", column1, [str, int],), ("column2", column2, [str, int],),]
         )
+        vdf_columns = self.get_columns()
         if isinstance(column1, int):
-            assert column1 < self.shape()[1], ParameterError("The parameter 'column1' is incorrect, it is greater or equal to the vDataFrame number of columns: {}>={}\nWhen this parameter type is 'integer', it must represent the index of the column to swap.".format(column1, self.shape()[1]))
-            column1 = self.get_columns()[column1]
+            assert column1 < len(vdf_columns), ParameterError("The parameter 'column1' is incorrect, it is greater or equal to the vDataFrame number of columns: {}>={}\nWhen this parameter type is 'integer', it must represent the index of the column to swap.".format(column1, len(vdf_columns)))
+            column1 = vdf_columns[column1]
         if isinstance(column2, int):
-            assert column2 < self.shape()[1], ParameterError("The parameter 'column2' is incorrect, it is greater or equal to the vDataFrame number of columns: {}>={}\nWhen this parameter type is 'integer', it must represent the index of the column to swap.".format(column2, self.shape()[1]))
-            column2 = self.get_columns()[column2]
+            assert column2 < len(vdf_columns), ParameterError("The parameter 'column2' is incorrect, it is greater or equal to the vDataFrame number of columns: {}>={}\nWhen this parameter type is 'integer', it must represent the index of the column to swap.".format(column2, len(vdf_columns)))
+            column2 = vdf_columns[column2]
         columns_check([column1, column2], self)
         column1 = vdf_columns_names([column1], self)[0]
         column2 = vdf_columns_names([column2], self)[0]
@@ -9358,8 +9513,8 @@ vColumns : vColumn
         ASC and "column2" DESC, write {"column1": "asc", "column2": "desc"}
     limit: int, optional
         If greater than 0, the maximum number of elements to write at the same time 
-        in the CSV file. It can be to use to minimize memory impacts. Be sure to keep
-        the same order to avoid unexpected results.
+        in the CSV file. It can be to use to minimize memory impacts. Otherwise, 
+        the elements are written by batches of 10000.
 
     Returns
     -------
@@ -9389,46 +9544,88 @@ vColumns : vColumn
                 ("limit", limit, [int, float],),
             ]
         )
-        file = open("{}{}.csv".format(path, name), "w+")
         columns = (
             self.get_columns()
             if not (usecols)
             else [str_column(column) for column in usecols]
         )
         assert not(new_header) or len(new_header) == len(columns), ParsingError("The header has an incorrect number of columns")
+        # Embedded quotechars are doubled (RFC 4180).
+        escaped_quotechar = quotechar * 2
+        header_names = []
         if new_header:
-            file.write(sep.join(new_header))
+            header_names = new_header
         elif header:
-            file.write(sep.join([column.replace('"', "") for column in columns]))
-        total = self.shape()[0]
-        current_nb_rows_written = 0
-        if limit <= 0:
-            limit = total
+            for column in columns:
+                column = column[1:-1]
+                if quotechar and (
+                    quotechar in column or sep in column or "\n" in column
+                ):
+                    column = (
+                        quotechar
+                        + column.replace(quotechar, escaped_quotechar)
+                        + quotechar
+                    )
+                header_names += [column]
+        # A column has a single type: its values are formatted column-wise
+        # with a rule chosen once. Unknown types keep the generic rule.
+        formats = []
+        for column in columns:
+            try:
+                ctype = getattr(self, column).ctype()
+                category = getattr(self, column).category()
+            except:
+                ctype, category = "", ""
+            if ctype.startswith(("varchar", "char", "long varchar")):
+                formats += ["text"]
+            elif category in ("int", "float", "date"):
+                formats += ["str"]
+            else:
+                formats += [""]
         order_by = sort_str(order_by, self)
         if not (order_by):
             order_by = last_order_by(self)
-        while current_nb_rows_written < total:
-            self._VERTICAPY_VARIABLES_["cursor"].execute(
-                "SELECT {} FROM {}{} LIMIT {} OFFSET {}".format(
-                    ", ".join(columns),
-                    self.__genSQL__(),
-                    order_by,
-                    limit,
-                    current_nb_rows_written,
-                )
-            )
-            result = self._VERTICAPY_VARIABLES_["cursor"].fetchall()
-            for row in result:
-                tmp_row = []
-                for item in row:
-                    if isinstance(item, str):
-                        tmp_row += [quotechar + item + quotechar]
-                    elif item == None:
-                        tmp_row += [na_rep]
-                    else:
-                        tmp_row += [str(item)]
-                file.write("\n" + sep.join(tmp_row))
-            current_nb_rows_written += limit
+        cursor = self._VERTICAPY_VARIABLES_["cursor"]
+        limit = int(limit) if (limit >= 1) else 10000
+        cursor.execute(
+            "SELECT {} FROM {}{}".format(", ".join(columns), self.__genSQL__(), order_by)
+        )
+        # The file is opened once the query succeeded so that a failure does
+        # not leave an empty file or a leaked handle behind.
+        file = open("{}{}.csv".format(path, name), "w+")
+        file.write(sep.join(header_names))
+        result = cursor.fetchmany(limit)
+        while result:
+            values = []
+            for fmt, items in zip(formats, zip(*result)):
+                if fmt == "text":
+                    values += [
+                        [
+                            na_rep
+                            if item == None
+                            else quotechar
+                            + item.replace(quotechar, escaped_quotechar)
+                            + quotechar
+                            for item in items
+                        ]
+                    ]
+                elif fmt == "str":
+                    values += [
+                        [na_rep if item == None else str(item) for item in items]
+                    ]
+                else:
+                    values += [
+                        [
+                            quotechar
+                            + item.replace(quotechar, escaped_quotechar)
+                            + quotechar
+                            if isinstance(item, str)
+                            else (na_rep if item == None else str(item))
+                            for item in items
+                        ]
+                    ]
+            file.writelines("\n" + sep.join(row) for row in zip(*values))
+            result = cursor.fetchmany(limit)
         file.close()
         return self
 
@@ -9557,9 +9754,8 @@ vColumns : vColumn
                 self._VERTICAPY_VARIABLES_["history"],
                 self._VERTICAPY_VARIABLES_["saving"],
             )
-            catalog_vars, columns = {}, self.get_columns()
-            for column in columns:
-                catalog_vars[column] = self[column].catalog
+            columns = self.get_columns()
+            catalog_vars = {column: getattr(self, column).catalog for column in columns}
             self.__init__(name, self._VERTICAPY_VARIABLES_["cursor"])
             self._VERTICAPY_VARIABLES_["history"] = history
             for column in columns:
@@ -9648,8 +9844,8 @@ vColumns : vColumn
         ASC and "column2" DESC, write {"column1": "asc", "column2": "desc"}
     limit: int, optional
         If greater than 0, the maximum number of elements to write at the same time 
-        in the JSON file. It can be to use to minimize memory impacts. Be sure to keep
-        the same order to avoid unexpected results.
+        in the JSON file. It can be to use to minimize memory impacts. Otherwise, 
+        the elements are written by batches of 10000.
 
     Returns
     -------
@@ -9674,40 +9870,39 @@ vColumns : vColumn
                 ("limit", limit, [int, float],),
             ]
         )
-        file = open("{}{}.json".format(path, name), "w+")
         columns = (
             self.get_columns()
             if not (usecols)
             else [str_column(column) for column in usecols]
         )
-        total = self.shape()[0]
-        current_nb_rows_written = 0
-        if limit <= 0:
-            limit = total
-        file.write("[\n")
+        keys = [str_column(column) + ": " for column in columns]
         order_by = sort_str(order_by, self)
         if not (order_by):
             order_by = last_order_by(self)
-        while current_nb_rows_written < total:
-            self._VERTICAPY_VARIABLES_["cursor"].execute(
-                "SELECT {} FROM {}{} LIMIT {} OFFSET {}".format(
-                    ", ".join(columns),
-                    self.__genSQL__(),
-                    order_by,
-                    limit,
-                    current_nb_rows_written,
+        cursor = self._VERTICAPY_VARIABLES_["cursor"]
+        limit = int(limit) if (limit >= 1) else 10000
+        cursor.execute(
+            "SELECT {} FROM {}{}".format(", ".join(columns), self.__genSQL__(), order_by)
+        )
+        file = open("{}{}.json".format(path, name), "w+")
+        file.write("[\n")
+        result = cursor.fetchmany(limit)
+        while result:
+            file.writelines(
+                "{"
+                + ", ".join(
+                    [
+                        key + '"' + item + '"'
+                        if isinstance(item, str)
+                        else key + str(item)
+                        for key, item in zip(keys, row)
+                        if item != None
+                    ]
                 )
+                + "},\n"
+                for row in result
             )
-            result = self._VERTICAPY_VARIABLES_["cursor"].fetchall()
-            for row in result:
-                tmp_row = []
-                for i, item in enumerate(row):
-                    if isinstance(item, str):
-                        tmp_row += ['{}: "{}"'.format(str_column(columns[i]), item)]
-                    elif item != None:
-                        tmp_row += ["{}: {}".format(str_column(columns[i]), item)]
-                file.write("{" + ", ".join(tmp_row) + "},\n")
-            current_nb_rows_written += limit
+            result = cursor.fetchmany(limit)
         file.write("]")
         file.close()
         return self
@@ -9725,17 +9920,34 @@ vColumns : vColumn
     List
         The list of the current vDataFrame relation.
         """
-        query = "SELECT * FROM {}{}".format(self.__genSQL__(), last_order_by(self))
+        # Vertica sends the numerical vColumns as floats. The others are
+        # only checked in case their type is not known.
+        columns = [
+            "{}::float AS {}".format(column, column)
+            if (getattr(self, column).category() == "float")
+            else column
+            for column in self.get_columns()
+        ]
+        query = "SELECT {} FROM {}{}".format(
+            ", ".join(columns), self.__genSQL__(), last_order_by(self)
+        )
         self.__executeSQL__(query, title="Gets the vDataFrame values.")
         result = self._VERTICAPY_VARIABLES_["cursor"].fetchall()
-        final_result = []
-        for elem in result:
-            final_result += [
-                [
-                    float(item) if isinstance(item, decimal.Decimal) else item
-                    for item in elem
-                ]
-            ]
+        final_result = [list(elem) for elem in result]
+        # A column has a single type: its first non-NULL value tells if
+        # it has to be converted.
+        decimal_idx = []
+        for i in range(len(final_result[0]) if (final_result) else 0):
+            for elem in final_result:
+                if elem[i] != None:
+                    if isinstance(elem[i], decimal.Decimal):
+                        decimal_idx += [i]
+                    break
+        if decimal_idx:
+            for elem in final_result:
+                for i in decimal_idx:
+                    if elem[i] != None:
+                        elem[i] = float(elem[i])
         return final_result
 
     # ---#
@@ -10040,13 +10252,6 @@ vColumns : vColumn
 
             ax = plot_importance(coeff_importances, print_legend=False, ax=ax,)
             ax.set_xlabel("IV")
-        index = [elem for elem in coeff_importances]
-        iv = [coeff_importances[elem] for elem in coeff_importances]
-        data = [(index[i], iv[i]) for i in range(len(iv))]
-        data = sorted(data, key=lambda tup: tup[1], reverse=True)
-        return tablesample(
-            {
-                "index": [elem[0] for elem in data],
-                "iv": [elem[1] for elem in data],
-            }
-        )
+        data = sorted(coeff_importances.items(), key=itemgetter(1), reverse=True)
+        index, iv = map(list, zip(*data)) if (data) else ([], [])
+        return tablesample({"index": index, "iv": iv})